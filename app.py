@@ -6,35 +6,27 @@ Enhanced with Multiple Arabic PDF Solutions
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
-import json
+import orjson
 import time
+import asyncio
+import random
+import threading
+from types import MappingProxyType
 import google.generativeai as genai
-from typing import Dict, List, Optional
+from google.api_core import exceptions as google_exceptions
+from typing import Callable, Dict, Iterator, List, Optional, TypedDict
 import re
 import os
 from dotenv import load_dotenv
 import logging
-import io
-import base64
-
-# PDF generation imports
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-from reportlab.lib import colors
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+import question_cache as qcache
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging for production
-logging.basicConfig(level=logging.INFO)
+# Configure logging for production (override with LOG_LEVEL, e.g. LOG_LEVEL=INFO)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
 logger = logging.getLogger(__name__)
 
 # Configure Streamlit page
@@ -46,8 +38,28 @@ st.set_page_config(
 )
 
 # Bilingual content structure
-CONTENT = {
-    'en': {
+# Leadership pillars, in the same order for both languages
+_PILLARS_EN = (
+    "Strategic Thinking",
+    "Leading Change & Adaptability",
+    "Effective Communication & Influence",
+    "Empowerment & Motivation",
+    "Responsibility & Accountability",
+    "Innovation & Continuous Improvement"
+)
+
+_PILLARS_AR = (
+    "التفكير الاستراتيجي",
+    "قيادة التغيير والتكيف",
+    "التأثير والتواصل الفعّال",
+    "التمكين وتحفيز الآخرين",
+    "تحمل المسؤولية والمساءلة",
+    "الابتكار والتحسين المستمر"
+)
+
+# Read-only UI text; MappingProxyType keeps render code from mutating it by accident
+CONTENT = MappingProxyType({
+    'en': MappingProxyType({
         'title': "🧠 Dynamic AI Leadership Assessment",
         'subtitle': "Comprehensive Leadership Evaluation - 7+7+1 Format",
         'language_label': "Language / اللغة",
@@ -56,6 +68,24 @@ CONTENT = {
         'begin_assessment': "🚀 Begin Assessment",
         'profile_title': "👤 Personal & Professional Profile",
         'profile_desc': "Your information shapes every aspect of your assessment",
+        'engine_ready': "🤖 Dynamic AI Assessment (7+7+1): Ready",
+        'field_name': "Full Name *",
+        'field_age': "Age *",
+        'field_experience': "Years of Experience *",
+        'field_position': "Current Position *",
+        'field_industry': "Industry *",
+        'field_country': "Country *",
+        'field_team_size': "Team Size",
+        'field_leadership_experience': "Leadership Experience (years)",
+        'field_company_size': "Company Size",
+        'field_education': "Education Level",
+        'additional_context': "### Additional Context",
+        'challenges_label': "Current leadership challenges you face:",
+        'challenges_placeholder': "Describe specific challenges in your role...",
+        'generate_assessment': "Generate 7+7+1 Assessment",
+        'fill_required': "Please fill all required fields",
+        'profile_spinner': "🤖 AI is creating your personalized 7+7+1 assessment...",
+        'profile_saved': "Profile saved! Generating 7 personalized Yes/No questions...",
         'assessment_progress': "Assessment Progress",
         'yes': "Yes",
         'no': "No", 
@@ -71,16 +101,64 @@ CONTENT = {
         'new_assessment': "🔄 New Assessment",
         'api_error': "API Configuration Error",
         'api_missing': "Gemini API key not found. Please check your .env file.",
-        'pillars': [
-            "Strategic Thinking",
-            "Leading Change & Adaptability", 
-            "Effective Communication & Influence",
-            "Empowerment & Motivation",
-            "Responsibility & Accountability",
-            "Innovation & Continuous Improvement"
-        ]
-    },
-    'ar': {
+        'yn_header': "📋 Part 1: Yes/No/Maybe Questions (7 Questions)",
+        'yn_info': "Comprehensive questions covering all leadership competencies",
+        'yn_spinner': "🤖 AI is creating 7 personalized Yes/No questions...",
+        'yn_success': "✨ 7 personalized questions generated!",
+        'yn_answer_label': "Your answer:",
+        'yn_progress': "Progress: Part 1 of 3 completed",
+        'yn_continue': "Continue to Multiple Choice Questions (7 Questions)",
+        'mcq_header': "📋 Part 2: Multiple Choice Questions (7 Questions)",
+        'mcq_info': "Complex scenarios tailored to your role and industry",
+        'mcq_spinner': "🤖 Creating 7 personalized scenario questions...",
+        'mcq_success': "✨ 7 personalized scenarios ready!",
+        'mcq_answer_label': "Select your approach:",
+        'mcq_progress': "Progress: Part 2 of 3 completed",
+        'mcq_back': "⬅️ Back to Yes/No Questions",
+        'mcq_continue': "Continue to Writing Scenario (1 Question)",
+        'scenario_header': "📝 Part 3: Leadership Writing Scenario (1 Question)",
+        'scenario_info': "A comprehensive scenario requiring detailed leadership analysis",
+        'scenario_spinner': "🤖 Creating your comprehensive leadership scenario...",
+        'scenario_success': "✨ Your comprehensive scenario is ready!",
+        'scenario_challenge': "### Your Leadership Challenge:",
+        'scenario_response_label': "Your comprehensive response (200-300 words recommended):",
+        'scenario_placeholder': "Provide a detailed leadership analysis including: your approach, specific actions, stakeholder management, risk mitigation, timeline, and expected outcomes...",
+        'scenario_progress': "Progress: All 3 parts ready for analysis",
+        'scenario_back': "⬅️ Back to Multiple Choice",
+        'generate_report': "🎯 Generate Detailed Report",
+        'scenario_too_short': "Please provide a more comprehensive response (at least 100 words).",
+        'report_spinner': "🧠 AI is analyzing all 15 responses (7+7+1) and creating your detailed report...",
+        'report_success': "🎉 Your detailed report is complete!",
+        'executive_summary': "📋 Executive Summary",
+        'overall_assessment': "🎯 Overall Leadership Assessment",
+        'justification': "**Justification:**",
+        'profile_breakdown': "📊 Leadership Profile Breakdown",
+        'evidence': "**Evidence from Your Responses:**",
+        'strengths': "🌟 Your Strengths",
+        'development_areas': "📈 Development Areas",
+        'response_patterns': "🔍 Response Pattern Analysis",
+        'yes_no_patterns': "**Yes/No/Maybe Patterns**",
+        'mcq_analysis': "**MCQ Choice Analysis**",
+        'writing_analysis': "**Writing Analysis**",
+        'recommendations': "💡 Personalized Recommendations",
+        'development_plan': "📅 Personal Development Plan",
+        'goals_30': "**30-Day Goals**",
+        'goals_90': "**90-Day Goals**",
+        'goals_6m': "**6-Month Goals**",
+        'cultural_context': "🌍 Cultural & Industry Context",
+        'closing_remarks': "🎯 Closing Remarks",
+        'pdf_spinner': "Generating enhanced PDF...",
+        'pdf_download': "📄 Download Enhanced PDF",
+        'pdf_ready': "Enhanced PDF ready!",
+        'print_hint': "Use Ctrl+P to print as PDF from browser",
+        'analytics': "📊 Assessment Analytics",
+        'analytics_soon': "Advanced analytics coming soon",
+        'word_count_low': "Word count: {count}. Add more detail for comprehensive analysis.",
+        'word_count_mid': "Word count: {count}. Good progress - consider adding more depth.",
+        'word_count_high': "Word count: {count} ✓ Excellent comprehensive response!",
+        'pillars': _PILLARS_EN
+    }),
+    'ar': MappingProxyType({
         'title': "🧠 مقياس القيادة الذكي الديناميكي",
         'subtitle': "تقييم قيادي شخصي بالكامل - نموذج 7+7+1",
         'language_label': "اللغة / Language",
@@ -89,6 +167,24 @@ CONTENT = {
         'begin_assessment': "🚀 بدء التقييم",
         'profile_title': "👤 الملف الشخصي والمهني",
         'profile_desc': "معلوماتك تشكل كل جانب من جوانب تقييمك",
+        'engine_ready': "🤖 التقييم الذكي الديناميكي (7+7+1): جاهز",
+        'field_name': "الاسم الكامل *",
+        'field_age': "العمر *",
+        'field_experience': "سنوات الخبرة *",
+        'field_position': "المنصب الحالي *",
+        'field_industry': "الصناعة *",
+        'field_country': "البلد *",
+        'field_team_size': "حجم الفريق",
+        'field_leadership_experience': "الخبرة القيادية (سنوات)",
+        'field_company_size': "حجم الشركة",
+        'field_education': "المستوى التعليمي",
+        'additional_context': "### سياق إضافي",
+        'challenges_label': "التحديات القيادية الحالية التي تواجهها:",
+        'challenges_placeholder': "صف التحديات المحددة في دورك...",
+        'generate_assessment': "إنشاء التقييم 7+7+1",
+        'fill_required': "يرجى ملء جميع الحقول المطلوبة",
+        'profile_spinner': "🤖 الذكاء الاصطناعي ينشئ تقييمك الشخصي 7+7+1...",
+        'profile_saved': "تم حفظ الملف الشخصي! جاري إنشاء 7 أسئلة نعم/لا شخصية...",
         'assessment_progress': "تقدم التقييم",
         'yes': "نعم",
         'no': "لا",
@@ -104,145 +200,279 @@ CONTENT = {
         'new_assessment': "🔄 تقييم جديد",
         'api_error': "خطأ في إعدادات API",
         'api_missing': "لم يتم العثور على مفتاح Gemini API",
-        'pillars': [
-            "التفكير الاستراتيجي",
-            "قيادة التغيير والتكيف",
-            "التأثير والتواصل الفعّال",
-            "التمكين وتحفيز الآخرين",
-            "تحمل المسؤولية والمساءلة",
-            "الابتكار والتحسين المستمر"
-        ]
+        'yn_header': "📋 الجزء الأول: أسئلة نعم/لا/ربما (7 أسئلة)",
+        'yn_info': "أسئلة شاملة تغطي جميع الكفاءات القيادية",
+        'yn_spinner': "🤖 الذكاء الاصطناعي ينشئ 7 أسئلة نعم/لا شخصية...",
+        'yn_success': "✨ تم إنشاء 7 أسئلة شخصية!",
+        'yn_answer_label': "إجابتك:",
+        'yn_progress': "التقدم: الجزء 1 من 3 مكتمل",
+        'yn_continue': "المتابعة للأسئلة متعددة الخيارات (7 أسئلة)",
+        'mcq_header': "📋 الجزء الثاني: أسئلة متعددة الخيارات (7 أسئلة)",
+        'mcq_info': "سيناريوهات معقدة مصممة لدورك ومجالك",
+        'mcq_spinner': "🤖 إنشاء 7 أسئلة سيناريو شخصية...",
+        'mcq_success': "✨ 7 سيناريوهات شخصية جاهزة!",
+        'mcq_answer_label': "اختر نهجك:",
+        'mcq_progress': "التقدم: الجزء 2 من 3 مكتمل",
+        'mcq_back': "⬅️ العودة لأسئلة نعم/لا",
+        'mcq_continue': "المتابعة لسيناريو الكتابة (سؤال واحد)",
+        'scenario_header': "📝 الجزء الثالث: سيناريو القيادة الكتابي (سؤال واحد)",
+        'scenario_info': "سيناريو شامل يتطلب تحليل قيادي مفصل",
+        'scenario_spinner': "🤖 إنشاء سيناريو القيادة الشامل...",
+        'scenario_success': "✨ سيناريوك الشامل جاهز!",
+        'scenario_challenge': "### تحديك القيادي:",
+        'scenario_response_label': "إجابتك الشاملة (يُنصح بـ 200-300 كلمة):",
+        'scenario_placeholder': "قدم تحليل قيادي مفصل يشمل: نهجك، الإجراءات المحددة، إدارة أصحاب المصلحة، تخفيف المخاطر، الجدول الزمني، والنتائج المتوقعة...",
+        'scenario_progress': "التقدم: جميع الأجزاء الثلاثة جاهزة للتحليل",
+        'scenario_back': "⬅️ العودة للأسئلة متعددة الخيارات",
+        'generate_report': "🎯 إنشاء التقرير المفصل",
+        'scenario_too_short': "يرجى تقديم إجابة أكثر شمولية (100 كلمة على الأقل).",
+        'report_spinner': "🧠 الذكاء الاصطناعي يحلل جميع الإجابات الـ15 (7+7+1) وينشئ تقريرك المفصل...",
+        'report_success': "🎉 تقريرك المفصل مكتمل!",
+        'executive_summary': "📋 الملخص التنفيذي",
+        'overall_assessment': "🎯 التقييم القيادي الإجمالي",
+        'justification': "**المبرر:**",
+        'profile_breakdown': "📊 تفصيل الملف القيادي",
+        'evidence': "**أدلة من إجاباتك:**",
+        'strengths': "🌟 نقاط قوتك",
+        'development_areas': "📈 مجالات التطوير",
+        'response_patterns': "🔍 تحليل أنماط الإجابات",
+        'yes_no_patterns': "**أنماط نعم/لا/ربما**",
+        'mcq_analysis': "**تحليل الاختيارات متعددة الخيارات**",
+        'writing_analysis': "**تحليل الكتابة**",
+        'recommendations': "💡 التوصيات الشخصية",
+        'development_plan': "📅 خطة التطوير الشخصية",
+        'goals_30': "**أهداف 30 يوم**",
+        'goals_90': "**أهداف 90 يوم**",
+        'goals_6m': "**أهداف 6 أشهر**",
+        'cultural_context': "🌍 السياق الثقافي والصناعي",
+        'closing_remarks': "🎯 ملاحظات ختامية",
+        'pdf_spinner': "جاري إنشاء PDF محسّن...",
+        'pdf_download': "📄 تحميل PDF محسّن",
+        'pdf_ready': "PDF محسّن جاهز!",
+        'print_hint': "استخدم Ctrl+P للطباعة كـ PDF من المتصفح",
+        'analytics': "📊 تحليلات التقييم",
+        'analytics_soon': "التحليلات المتقدمة قادمة قريباً",
+        'word_count_low': "عدد الكلمات: {count}. أضف المزيد من التفاصيل للتحليل الشامل.",
+        'word_count_mid': "عدد الكلمات: {count}. تقدم جيد - فكر في إضافة المزيد من العمق.",
+        'word_count_high': "عدد الكلمات: {count} ✓ إجابة شاملة ممتازة!",
+        'pillars': _PILLARS_AR
+    })
+})
+
+# Profile form options, built once at import instead of on every rerun
+INDUSTRY_OPTIONS = {
+    'en': ("Technology", "Healthcare", "Finance", "Education", "Manufacturing",
+           "Retail", "Consulting", "Government", "Non-profit", "Energy",
+           "Telecommunications", "Media", "Real Estate", "Other"),
+    'ar': ("التكنولوجيا", "الرعاية الصحية", "المالية", "التعليم", "التصنيع",
+           "التجارة", "الاستشارات", "الحكومة", "غير ربحي", "الطاقة",
+           "الاتصالات", "الإعلام", "العقارات", "أخرى")
+}
+
+TEAM_SIZE_OPTIONS = {
+    'en': ("No direct reports", "1-5", "6-15", "16-50", "50+"),
+    'ar': ("لا يوجد مرؤوسين", "1-5", "6-15", "16-50", "أكثر من 50")
+}
+
+COMPANY_SIZE_OPTIONS = {
+    'en': ("Startup (1-50)", "Small (51-200)", "Medium (201-1000)", "Large (1001-5000)", "Enterprise (5000+)"),
+    'ar': ("ناشئة (1-50)", "صغيرة (51-200)", "متوسطة (201-1000)", "كبيرة (1001-5000)", "مؤسسة (5000+)")
+}
+
+EDUCATION_OPTIONS = {
+    'en': ("High School", "Bachelor's", "Master's", "PhD", "Professional Cert"),
+    'ar': ("ثانوية", "بكالوريوس", "ماجستير", "دكتوراه", "شهادة مهنية")
+}
+
+# Typical length of a detailed report response, used to scale the streaming progress bar
+REPORT_EXPECTED_CHARS = 12000
+
+# Scenario word-count guidance per bucket (<100, <200, 200+): Streamlit call and CONTENT key
+WORD_COUNT_NOTICES = (
+    ('warning', 'word_count_low'),
+    ('info', 'word_count_mid'),
+    ('success', 'word_count_high')
+)
+
+# Separates the questions with a rule under each radio instead of one markdown element per question
+QUESTION_SEPARATOR_CSS = (
+    "<style>div[data-testid='stRadio']{border-bottom:1px solid #eee;"
+    "padding-bottom:0.75rem;margin-bottom:0.75rem;}</style>"
+)
+
+WELCOME_TEXT = {
+    'en': """
+    ### 🚀 Comprehensive Dynamic Leadership Assessment System
+    
+    **Assessment Structure:**
+    - **7 Yes/No/Maybe Questions**: Covering all leadership pillars
+    - **7 Multiple Choice Questions**: Diverse leadership scenarios
+    - **1 Writing Scenario**: Comprehensive leadership analysis
+    
+    **Features:**
+    - No Predefined Questions
+    - Personalized Analysis based on actual responses
+    - Enhanced PDF Report with Multiple Arabic Solutions
+    - Custom Development Plan for your role and industry
+    
+    ✅ **AI Engine Ready for Comprehensive Assessment**
+    """,
+    'ar': """
+    ### 🚀 نظام تقييم قيادي ديناميكي شامل
+    
+    **هيكل التقييم:**
+    - **7 أسئلة نعم/لا/ربما**: تغطي جميع أركان القيادة
+    - **7 أسئلة متعددة الخيارات**: سيناريوهات قيادية متنوعة
+    - **1 سيناريو كتابي**: تحليل قيادي شامل ومعمق
+    
+    **المميزات:**
+    - لا توجد أسئلة محددة مسبقاً
+    - تحليل شخصي مبني على إجاباتك الفعلية
+    - تقرير PDF باللغة العربية (محسّن ومطور)
+    - خطة تطوير مخصصة لدورك ومجالك
+    
+    ✅ **محرك الذكاء الاصطناعي جاهز للتقييم الشامل**
+    """
+}
+
+# Print stylesheet for the Arabic HTML report, kept out of the f-string template
+ARABIC_REPORT_CSS = """
+@page {
+    size: A4;
+    margin: 2cm;
+    @bottom-center {
+        content: "صفحة " counter(page);
+        font-size: 10px;
     }
 }
 
-class ArabicFontPDFGenerator:
-    """Enhanced PDF generator with Arabic font support."""
-    
-    def __init__(self, language='en'):
-        self.language = language
-        self.story = []
-        self.styles = getSampleStyleSheet()
-        self.arabic_font = self._register_arabic_font()
-        self._setup_styles()
-    
-    def _register_arabic_font(self):
-        """Register Arabic-compatible fonts."""
-        try:
-            # Try to register system fonts that support Arabic
-            font_paths = [
-                'C:/Windows/Fonts/arial.ttf',  # Windows
-                'C:/Windows/Fonts/calibri.ttf',
-                'C:/Windows/Fonts/tahoma.ttf',
-                '/System/Library/Fonts/Arial.ttf',  # macOS
-                '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',  # Linux
-                '/usr/share/fonts/TTF/arial.ttf'
-            ]
-            
-            for font_path in font_paths:
-                if os.path.exists(font_path):
-                    try:
-                        pdfmetrics.registerFont(TTFont('ArabicFont', font_path))
-                        return 'ArabicFont'
-                    except:
-                        continue
-        except Exception as e:
-            logger.warning(f"Font registration failed: {e}")
-        
-        return 'Helvetica'  # Fallback
-    
-    def _setup_styles(self):
-        """Setup styles with Arabic font support."""
-        if self.language == 'ar':
-            self.title_style = ParagraphStyle(
-                'ArabicTitle',
-                parent=self.styles['Title'],
-                fontSize=18,
-                alignment=TA_CENTER,
-                fontName=self.arabic_font,
-                spaceAfter=20,
-                textColor=colors.darkblue
-            )
-            
-            self.heading_style = ParagraphStyle(
-                'ArabicHeading',
-                parent=self.styles['Heading1'],
-                fontSize=14,
-                alignment=TA_RIGHT,
-                fontName=self.arabic_font,
-                spaceAfter=12,
-                textColor=colors.darkblue
-            )
-            
-            self.normal_style = ParagraphStyle(
-                'ArabicNormal',
-                parent=self.styles['Normal'],
-                fontSize=11,
-                alignment=TA_RIGHT,
-                fontName=self.arabic_font,
-                spaceAfter=8
-            )
-        else:
-            self.title_style = self.styles['Title']
-            self.heading_style = self.styles['Heading1']
-            self.normal_style = self.styles['Normal']
-    
-    def clean_arabic_text(self, text):
-        """Clean Arabic text for PDF rendering."""
-        if not text:
-            return ""
-        
-        text = str(text)
-        # Remove black squares and problematic characters
-        text = text.replace('■', '').replace('□', '').replace('▪', '')
-        
-        # For Arabic text, try to preserve as much as possible
-        if self.language == 'ar':
-            try:
-                # Try to process Arabic text
-                import arabic_reshaper
-                from bidi.algorithm import get_display
-                
-                reshaped_text = arabic_reshaper.reshape(text)
-                bidi_text = get_display(reshaped_text)
-                return bidi_text
-            except:
-                # If processing fails, return cleaned text
-                return text
-        
-        return text
-    
-    def add_title(self, title):
-        """Add title with proper Arabic support."""
-        clean_title = self.clean_arabic_text(title)
-        title_para = Paragraph(clean_title, self.title_style)
-        self.story.append(title_para)
-        self.story.append(Spacer(1, 20))
-    
-    def add_section(self, heading, content):
-        """Add section with Arabic support."""
-        clean_heading = self.clean_arabic_text(heading)
-        heading_para = Paragraph(clean_heading, self.heading_style)
-        self.story.append(heading_para)
-        
-        if isinstance(content, list):
-            for item in content:
-                clean_item = self.clean_arabic_text(item)
-                para = Paragraph(f"• {clean_item}", self.normal_style)
-                self.story.append(para)
-        else:
-            clean_content = self.clean_arabic_text(content)
-            para = Paragraph(clean_content, self.normal_style)
-            self.story.append(para)
-        
-        self.story.append(Spacer(1, 15))
-    
-    def generate_pdf(self):
-        """Generate PDF with Arabic support."""
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=50, leftMargin=50)
-        doc.build(self.story)
-        buffer.seek(0)
-        return buffer.getvalue()
+body {
+    font-family: 'Segoe UI', 'Tahoma', 'Arial', sans-serif;
+    font-size: 12px;
+    line-height: 1.8;
+    color: #333;
+    direction: rtl;
+    text-align: right;
+    margin: 0;
+    padding: 20px;
+}
+
+.header {
+    text-align: center;
+    border-bottom: 3px solid #2c5aa0;
+    padding-bottom: 20px;
+    margin-bottom: 30px;
+}
+
+.title {
+    font-size: 24px;
+    font-weight: bold;
+    color: #2c5aa0;
+    margin-bottom: 10px;
+}
+
+.user-info {
+    background-color: #f8f9fa;
+    padding: 20px;
+    border-radius: 8px;
+    margin-bottom: 25px;
+    border-right: 4px solid #2c5aa0;
+}
+
+.section-title {
+    font-size: 18px;
+    font-weight: bold;
+    color: #2c5aa0;
+    border-bottom: 2px solid #2c5aa0;
+    padding-bottom: 8px;
+    margin-top: 30px;
+    margin-bottom: 15px;
+}
+
+.pillar-section {
+    background-color: #f8f9fa;
+    padding: 15px;
+    margin-bottom: 15px;
+    border-radius: 5px;
+    border-right: 4px solid #2c5aa0;
+}
+
+.pillar-title {
+    font-size: 16px;
+    font-weight: bold;
+    color: #2c5aa0;
+    margin-bottom: 10px;
+}
+
+.score {
+    background-color: #2c5aa0;
+    color: white;
+    padding: 5px 15px;
+    border-radius: 15px;
+    font-weight: bold;
+    display: inline-block;
+    margin: 5px 0;
+}
+
+.recommendation {
+    background-color: #e7f3ff;
+    padding: 15px;
+    margin: 10px 0;
+    border-radius: 5px;
+    border-right: 3px solid #2c5aa0;
+}
+
+.goal-section {
+    margin-bottom: 20px;
+}
+
+.goal-title {
+    font-size: 14px;
+    font-weight: bold;
+    color: #2c5aa0;
+    margin-bottom: 10px;
+}
+
+.no-print {
+    display: block;
+}
+
+@media print {
+    .no-print {
+        display: none !important;
+    }
+    body {
+        margin: 0;
+        padding: 0;
+    }
+}
+
+.print-button {
+    background-color: #2c5aa0;
+    color: white;
+    padding: 12px 24px;
+    border: none;
+    border-radius: 5px;
+    font-size: 16px;
+    cursor: pointer;
+    margin: 20px 0;
+    display: block;
+    margin-right: auto;
+    margin-left: auto;
+}
+
+.print-button:hover {
+    background-color: #1e3a6f;
+}
+
+ul {
+    padding-right: 20px;
+}
+
+li {
+    margin-bottom: 8px;
+}
+"""
 
 class HTMLReportGenerator:
     """Generate HTML reports for browser-based PDF printing."""
@@ -254,7 +484,7 @@ class HTMLReportGenerator:
         """Generate complete HTML report for printing."""
         
         if self.language == 'ar':
-            html_content = f'''
+            parts = [f'''
             <!DOCTYPE html>
             <html lang="ar" dir="rtl">
             <head>
@@ -262,141 +492,7 @@ class HTMLReportGenerator:
                 <meta name="viewport" content="width=device-width, initial-scale=1.0">
                 <title>تقرير تقييم القيادة الشخصي</title>
                 <style>
-                    @page {{
-                        size: A4;
-                        margin: 2cm;
-                        @bottom-center {{
-                            content: "صفحة " counter(page);
-                            font-size: 10px;
-                        }}
-                    }}
-                    
-                    body {{
-                        font-family: 'Segoe UI', 'Tahoma', 'Arial', sans-serif;
-                        font-size: 12px;
-                        line-height: 1.8;
-                        color: #333;
-                        direction: rtl;
-                        text-align: right;
-                        margin: 0;
-                        padding: 20px;
-                    }}
-                    
-                    .header {{
-                        text-align: center;
-                        border-bottom: 3px solid #2c5aa0;
-                        padding-bottom: 20px;
-                        margin-bottom: 30px;
-                    }}
-                    
-                    .title {{
-                        font-size: 24px;
-                        font-weight: bold;
-                        color: #2c5aa0;
-                        margin-bottom: 10px;
-                    }}
-                    
-                    .user-info {{
-                        background-color: #f8f9fa;
-                        padding: 20px;
-                        border-radius: 8px;
-                        margin-bottom: 25px;
-                        border-right: 4px solid #2c5aa0;
-                    }}
-                    
-                    .section-title {{
-                        font-size: 18px;
-                        font-weight: bold;
-                        color: #2c5aa0;
-                        border-bottom: 2px solid #2c5aa0;
-                        padding-bottom: 8px;
-                        margin-top: 30px;
-                        margin-bottom: 15px;
-                    }}
-                    
-                    .pillar-section {{
-                        background-color: #f8f9fa;
-                        padding: 15px;
-                        margin-bottom: 15px;
-                        border-radius: 5px;
-                        border-right: 4px solid #2c5aa0;
-                    }}
-                    
-                    .pillar-title {{
-                        font-size: 16px;
-                        font-weight: bold;
-                        color: #2c5aa0;
-                        margin-bottom: 10px;
-                    }}
-                    
-                    .score {{
-                        background-color: #2c5aa0;
-                        color: white;
-                        padding: 5px 15px;
-                        border-radius: 15px;
-                        font-weight: bold;
-                        display: inline-block;
-                        margin: 5px 0;
-                    }}
-                    
-                    .recommendation {{
-                        background-color: #e7f3ff;
-                        padding: 15px;
-                        margin: 10px 0;
-                        border-radius: 5px;
-                        border-right: 3px solid #2c5aa0;
-                    }}
-                    
-                    .goal-section {{
-                        margin-bottom: 20px;
-                    }}
-                    
-                    .goal-title {{
-                        font-size: 14px;
-                        font-weight: bold;
-                        color: #2c5aa0;
-                        margin-bottom: 10px;
-                    }}
-                    
-                    .no-print {{
-                        display: block;
-                    }}
-                    
-                    @media print {{
-                        .no-print {{
-                            display: none !important;
-                        }}
-                        body {{
-                            margin: 0;
-                            padding: 0;
-                        }}
-                    }}
-                    
-                    .print-button {{
-                        background-color: #2c5aa0;
-                        color: white;
-                        padding: 12px 24px;
-                        border: none;
-                        border-radius: 5px;
-                        font-size: 16px;
-                        cursor: pointer;
-                        margin: 20px 0;
-                        display: block;
-                        margin-right: auto;
-                        margin-left: auto;
-                    }}
-                    
-                    .print-button:hover {{
-                        background-color: #1e3a6f;
-                    }}
-                    
-                    ul {{
-                        padding-right: 20px;
-                    }}
-                    
-                    li {{
-                        margin-bottom: 8px;
-                    }}
+                    {ARABIC_REPORT_CSS}
                 </style>
             </head>
             <body>
@@ -427,33 +523,24 @@ class HTMLReportGenerator:
                 <p>{report_data.get('overall_leadership_score', {}).get('justification', 'المبرر غير متوفر.')}</p>
                 
                 <div class="section-title">تفصيل الملف القيادي</div>
-            '''
+            ''']
             
             # Add pillar sections
             profile_breakdown = report_data.get('leadership_profile_breakdown', {})
-            arabic_pillars = [
-                "التفكير الاستراتيجي",
-                "قيادة التغيير والتكيف",
-                "التأثير والتواصل الفعّال",
-                "التمكين وتحفيز الآخرين",
-                "تحمل المسؤولية والمساءلة",
-                "الابتكار والتحسين المستمر"
-            ]
-            
-            for pillar in arabic_pillars:
+            for pillar in _PILLARS_AR:
                 pillar_data = profile_breakdown.get(pillar, {})
                 if pillar_data:
                     score = pillar_data.get('score', 0)
                     analysis = pillar_data.get('analysis', 'التحليل غير متوفر.')
-                    html_content += f'''
+                    parts.append(f'''
                     <div class="pillar-section">
                         <div class="pillar-title">{pillar} <span class="score">{score}/10</span></div>
                         <p>{analysis}</p>
                     </div>
-                    '''
+                    ''')
             
             # Add other sections
-            html_content += f'''
+            parts.append(f'''
                 <div class="section-title">نقاط القوة</div>
                 <p>{report_data.get('overall_strengths', 'تحليل نقاط القوة غير متوفر.')}</p>
                 
@@ -461,62 +548,45 @@ class HTMLReportGenerator:
                 <p>{report_data.get('overall_development_areas', 'تحليل مجالات التطوير غير متوفر.')}</p>
                 
                 <div class="section-title">التوصيات الشخصية</div>
-            '''
+            ''')
             
             # Add recommendations
             recommendations = report_data.get('personalized_recommendations', [])
-            for i, rec in enumerate(recommendations, 1):
-                html_content += f'<div class="recommendation">{i}. {rec}</div>'
+            parts.extend(f'<div class="recommendation">{i}. {rec}</div>' for i, rec in enumerate(recommendations, 1))
             
-            html_content += '''
+            parts.append('''
                 <div class="section-title">خطة التطوير الشخصية</div>
-            '''
+            ''')
             
             # Add development plan
             dev_plan = report_data.get('personal_development_plan', {})
             if dev_plan:
-                html_content += '''
+                for goal_title, goals_key in (('أهداف 30 يوم', '30_day_goals'),
+                                              ('أهداف 90 يوم', '90_day_goals'),
+                                              ('أهداف 6 أشهر', '6_month_goals')):
+                    goal_items = ''.join(f'<li>{goal}</li>' for goal in dev_plan.get(goals_key, []))
+                    parts.append(f'''
                 <div class="goal-section">
-                    <div class="goal-title">أهداف 30 يوم</div>
-                    <ul>
-                '''
-                for goal in dev_plan.get('30_day_goals', []):
-                    html_content += f'<li>{goal}</li>'
-                html_content += '</ul></div>'
-                
-                html_content += '''
-                <div class="goal-section">
-                    <div class="goal-title">أهداف 90 يوم</div>
-                    <ul>
-                '''
-                for goal in dev_plan.get('90_day_goals', []):
-                    html_content += f'<li>{goal}</li>'
-                html_content += '</ul></div>'
-                
-                html_content += '''
-                <div class="goal-section">
-                    <div class="goal-title">أهداف 6 أشهر</div>
-                    <ul>
-                '''
-                for goal in dev_plan.get('6_month_goals', []):
-                    html_content += f'<li>{goal}</li>'
-                html_content += '</ul></div>'
+                    <div class="goal-title">{goal_title}</div>
+                    <ul>{goal_items}</ul></div>
+                ''')
             
             # Add closing remarks
             closing = report_data.get('closing_remarks')
             if closing:
-                html_content += f'''
+                parts.append(f'''
                 <div class="section-title">ملاحظات ختامية</div>
                 <p>{closing}</p>
-                '''
+                ''')
             
-            html_content += '''
+            parts.append('''
                 <div class="no-print">
                     <button class="print-button" onclick="window.print()">🖨️ طباعة التقرير كـ PDF</button>
                 </div>
             </body>
             </html>
-            '''
+            ''')
+            html_content = ''.join(parts)
             
         else:
             # English HTML template (similar structure but left-aligned)
@@ -551,6 +621,104 @@ class HTMLReportGenerator:
         
         return html_content
 
+class MCQQuestion(TypedDict):
+    """Response schema for a single generated MCQ question."""
+    question: str
+    options: List[str]
+    pillar: str
+
+# JSON mode: Gemini returns a schema-validated array with no markdown fences
+MCQ_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": list[MCQQuestion]
+}
+
+class YesNoQuestion(TypedDict):
+    """Response schema for a single generated Yes/No/Maybe question."""
+    question: str
+    pillar: str
+
+YES_NO_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": list[YesNoQuestion]
+}
+
+class AssessmentContent(TypedDict):
+    """Response schema for the combined 7+7+1 generation call."""
+    yes_no: list[YesNoQuestion]
+    mcq: list[MCQQuestion]
+    scenario: str
+
+FULL_ASSESSMENT_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": AssessmentContent
+}
+
+# The report structure is described in its prompt; JSON mode alone guarantees bare JSON output
+REPORT_GENERATION_CONFIG = {
+    "response_mime_type": "application/json"
+}
+
+# Markdown code fences (```json / ```) around AI JSON responses
+_FENCE_RE = re.compile(r'```(?:json)?\n?')
+
+# Validated model responses are reused from disk for this many seconds (0 disables the cache,
+# e.g. RESPONSE_CACHE_TTL=0 when testing how much the generated questions vary)
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 7 * 86400))
+
+# Input size above which a prompt is logged as bloated (roughly 4 characters per token)
+PROMPT_CHAR_BUDGET = int(os.getenv("PROMPT_CHAR_BUDGET", 16000))
+
+# Required keys for the generated payloads, checked with a single set difference
+_YES_NO_REQUIRED = frozenset({'question', 'pillar'})
+_MCQ_REQUIRED = frozenset({'question', 'options', 'pillar'})
+_REPORT_REQUIRED = frozenset({
+    'report_title', 'executive_summary', 'overall_leadership_score',
+    'leadership_profile_breakdown', 'overall_strengths', 'overall_development_areas',
+    'detailed_insights_from_response_types', 'personalized_recommendations',
+    'personal_development_plan', 'cultural_and_industry_nuances', 'closing_remarks'
+})
+
+def _compact_prompt(prompt: str) -> str:
+    """Strip the source indentation from a triple-quoted prompt and warn if it is over budget."""
+    compact = "\n".join(line.strip() for line in prompt.strip().splitlines())
+    if len(compact) > PROMPT_CHAR_BUDGET:
+        logger.warning("Prompt is %d characters, over the %d character budget", len(compact), PROMPT_CHAR_BUDGET)
+    return compact
+
+def _score_in_range(score, lo: float = 1.0, hi: float = 10.0) -> bool:
+    """Return True if score is a real number within [lo, hi]."""
+    return isinstance(score, (int, float)) and lo <= score <= hi
+
+def _response_text(response, generation_config: Optional[Dict] = None) -> Optional[str]:
+    """Read the response text once; JSON mode guarantees a single text part."""
+    if not response:
+        return None
+    if generation_config and generation_config.get('response_mime_type') == 'application/json':
+        return response.candidates[0].content.parts[0].text
+    return response.text
+
+def _retry_delay(attempt: int, error: Exception, cap: float = 10.0) -> float:
+    """Jittered exponential backoff; only rate-limit and server errors wait."""
+    # Rate limits and overload take seconds to clear: wait up to min(cap, 2 ** attempt) seconds
+    if isinstance(error, (google_exceptions.TooManyRequests, google_exceptions.ServiceUnavailable)):
+        return random.uniform(0, min(cap, 2 ** attempt))
+    # Other server errors are usually transient, so they retry after ~50ms
+    if isinstance(error, google_exceptions.ServerError):
+        return min(cap, 0.05 * (1.3 ** attempt)) * random.uniform(0.5, 1.5)
+    return 0.0
+
+def _is_auth_error(error: Exception) -> bool:
+    """Detect invalid or unauthorized API key errors, which retrying cannot fix."""
+    if isinstance(error, (google_exceptions.Unauthenticated, google_exceptions.PermissionDenied)):
+        return True
+    return isinstance(error, google_exceptions.InvalidArgument) and "API key" in str(error)
+
+def _is_permanent_error(error: Exception) -> bool:
+    """4xx errors other than 429 fail the same way on every attempt, so they are not retried."""
+    return (isinstance(error, google_exceptions.ClientError)
+            and not isinstance(error, google_exceptions.TooManyRequests))
+
 class DynamicLeadershipAssessment:
     """Production-ready dynamic AI assessment engine with multiple Arabic PDF solutions."""
     
@@ -560,68 +728,145 @@ class DynamicLeadershipAssessment:
             raise ValueError("GEMINI_API_KEY not found in environment variables")
         
         genai.configure(api_key=self.api_key)
+        # Built once per engine (the engine itself is a get_engine() singleton) so every
+        # call reuses the same client channel. Never reassign or rebuild self.model per call.
         self.model = genai.GenerativeModel('gemini-1.5-flash')
         
-        # Test API connection
-        self._test_connection()
+        # No startup round-trip: the first real call surfaces auth/connectivity errors
         logger.info("Dynamic Assessment Engine initialized successfully")
     
-    def _test_connection(self):
-        """Test API connection with retry mechanism."""
-        max_retries = 3
+    def _make_api_call_with_retry(self, prompt: str, max_retries: int = 3,
+                                  generation_config: Optional[Dict] = None) -> str:
+        """Make API call with retry mechanism and validation."""
         for attempt in range(max_retries):
             try:
-                test_response = self.model.generate_content("Respond with: API_TEST_SUCCESS")
-                if test_response and "API_TEST_SUCCESS" in test_response.text:
-                    return True
-                else:
-                    raise Exception("API test response invalid")
+                response = self.model.generate_content(prompt, generation_config=generation_config)
+                text = _response_text(response, generation_config)
+                if not text:
+                    raise Exception("Empty response from API")
+                
+                logger.info("API call successful on attempt %d", attempt + 1)
+                return text.strip()
+                
             except Exception as e:
+                if _is_auth_error(e):
+                    raise Exception(f"API authentication failed, please check GEMINI_API_KEY: {str(e)}")
+                if _is_permanent_error(e):
+                    raise Exception(f"API request rejected: {str(e)}")
+                logger.warning("API call attempt %d failed: %s", attempt + 1, e)
                 if attempt == max_retries - 1:
-                    raise Exception(f"API connection failed after {max_retries} attempts: {str(e)}")
-                time.sleep(2 ** attempt)
+                    raise Exception(f"API call failed after {max_retries} attempts: {str(e)}")
+                time.sleep(_retry_delay(attempt, e))
     
-    def _make_api_call_with_retry(self, prompt: str, max_retries: int = 3) -> str:
-        """Make API call with retry mechanism and validation."""
+    async def _make_api_call_async(self, prompt: str, max_retries: int = 3,
+                                   generation_config: Optional[Dict] = None) -> str:
+        """Async API call with the same retry mechanism, used for concurrent generation."""
         for attempt in range(max_retries):
             try:
-                response = self.model.generate_content(prompt)
-                if not response or not response.text:
+                response = await self.model.generate_content_async(prompt, generation_config=generation_config)
+                text = _response_text(response, generation_config)
+                if not text:
                     raise Exception("Empty response from API")
                 
-                logger.info(f"API call successful on attempt {attempt + 1}")
-                return response.text.strip()
+                logger.info("Async API call successful on attempt %d", attempt + 1)
+                return text.strip()
+            
+            except Exception as e:
+                if _is_auth_error(e):
+                    raise Exception(f"API authentication failed, please check GEMINI_API_KEY: {str(e)}")
+                if _is_permanent_error(e):
+                    raise Exception(f"API request rejected: {str(e)}")
+                logger.warning("Async API call attempt %d failed: %s", attempt + 1, e)
+                if attempt == max_retries - 1:
+                    raise Exception(f"API call failed after {max_retries} attempts: {str(e)}")
+                await asyncio.sleep(_retry_delay(attempt, e))
+    
+    def _make_api_call_stream(self, prompt: str, max_retries: int = 3,
+                              generation_config: Optional[Dict] = None) -> Iterator[str]:
+        """Stream response text chunks as they arrive; retries only before the first chunk."""
+        for attempt in range(max_retries):
+            streamed = False
+            try:
+                for chunk in self.model.generate_content(prompt, generation_config=generation_config, stream=True):
+                    text = chunk.text
+                    if text:
+                        streamed = True
+                        yield text
+                if not streamed:
+                    raise Exception("Empty response from API")
                 
+                logger.info("Streaming API call successful on attempt %d", attempt + 1)
+                return
+            
             except Exception as e:
-                logger.warning(f"API call attempt {attempt + 1} failed: {str(e)}")
+                if streamed:
+                    raise Exception(f"API stream interrupted: {str(e)}")
+                if _is_auth_error(e):
+                    raise Exception(f"API authentication failed, please check GEMINI_API_KEY: {str(e)}")
+                if _is_permanent_error(e):
+                    raise Exception(f"API request rejected: {str(e)}")
+                logger.warning("Streaming API call attempt %d failed: %s", attempt + 1, e)
                 if attempt == max_retries - 1:
                     raise Exception(f"API call failed after {max_retries} attempts: {str(e)}")
-                time.sleep(2 ** attempt)
+                time.sleep(_retry_delay(attempt, e))
+    
+    def _stream_text(self, prompt: str, on_chunk: Callable[[str], None],
+                     generation_config: Optional[Dict] = None) -> str:
+        """Stream a response, passing each new chunk to on_chunk, and return the full text."""
+        parts = []
+        for text in self._make_api_call_stream(prompt, generation_config=generation_config):
+            parts.append(text)
+            on_chunk(text)
+        return "".join(parts).strip()
+    
+    def _cached_api_call(self, prompt: str, parse: Callable[[str], object],
+                         generation_config: Optional[Dict] = None,
+                         fetch: Optional[Callable[[], str]] = None):
+        """Return parse(response text), reusing a previously validated response for the same model, config and prompt."""
+        if fetch is None:
+            fetch = lambda: self._make_api_call_with_retry(prompt, generation_config=generation_config)
+        if not RESPONSE_CACHE_TTL:
+            return parse(fetch())
+        
+        key = qcache.response_key(self.model.model_name, prompt, generation_config)
+        cached = qcache.get(key, max_age=RESPONSE_CACHE_TTL)
+        if cached is not None:
+            try:
+                result = parse(cached)
+                logger.info("Response cache hit")
+                return result
+            except Exception as e:
+                logger.warning("Discarding cached response that failed validation: %s", e)
+        
+        text = fetch()
+        result = parse(text)
+        # Only responses that passed validation are stored
+        qcache.set(key, text)
+        qcache.prune(RESPONSE_CACHE_TTL)
+        return result
     
     def _clean_and_parse_json(self, text: str) -> Dict:
         """Clean and parse JSON response with validation."""
-        # Remove markdown formatting
-        text = re.sub(r'json\n?', '', text)
-        text = re.sub(r'```\n?', '', text)
-        text = re.sub(r'', '', text)
         text = text.strip()
+        # Remove markdown formatting unless the response is already bare JSON
+        if not text.startswith(('{', '[')):
+            text = _FENCE_RE.sub('', text).strip()
         
         try:
-            parsed_data = json.loads(text)
+            parsed_data = orjson.loads(text)
             return parsed_data
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing failed: {str(e)}")
-            logger.error(f"Raw text: {text[:500]}...")
+        except orjson.JSONDecodeError as e:
+            logger.error("JSON parsing failed: %s", e)
+            logger.error("Raw text: %.500s...", text)
             raise Exception(f"Failed to parse AI response as JSON: {str(e)}")
     
-    def generate_comprehensive_yes_no_questions(self, language: str, user_profile: Dict) -> List[Dict]:
-        """Generate 7 comprehensive Yes/No/Maybe questions covering all leadership pillars."""
-        
-        lang_instruction = "in Arabic language only" if language == 'ar' else "in English language only"
+    def _build_profile_context(self, user_profile: Dict) -> str:
+        """Build the personalization block shared verbatim by every prompt."""
+        pillars = "\n".join(
+            f"        {i}. {pillar}" for i, pillar in enumerate(CONTENT['en']['pillars'], 1)
+        )
         
-        prompt = f"""
-        You are an expert leadership psychologist creating a comprehensive assessment. Generate exactly 7 unique Yes/No/Maybe questions {lang_instruction} that cover all leadership competencies.
-
+        return f"""
         PERSONALIZATION CONTEXT:
         - Name: {user_profile.get('name')}
         - Position: {user_profile.get('current_position')}
@@ -631,205 +876,257 @@ class DynamicLeadershipAssessment:
         - Team Size: {user_profile.get('team_size')}
         - Company Size: {user_profile.get('company_size')}
         - Country: {user_profile.get('country')}
+        - Age: {user_profile.get('age')}
+        - Education: {user_profile.get('education')}
+        - Current Challenges: {user_profile.get('current_challenges')}
 
-        LEADERSHIP PILLARS TO COVER:
-        1. Strategic Thinking
-        2. Leading Change & Adaptability
-        3. Effective Communication & Influence
-        4. Empowerment & Motivation
-        5. Responsibility & Accountability
-        6. Innovation & Continuous Improvement
-        7. Overall Leadership Effectiveness
+        LEADERSHIP PILLARS:
+{pillars}
+        """
+    
+    def _build_yes_no_prompt(self, language: str, user_profile: Dict) -> str:
+        """Build the prompt for 7 comprehensive Yes/No/Maybe questions."""
+        
+        lang_instruction = "in Arabic language only" if language == 'ar' else "in English language only"
+        
+        prompt = self._build_profile_context(user_profile) + f"""
+        You are an expert leadership psychologist. Generate exactly 7 unique Yes/No/Maybe questions {lang_instruction}: one for each of the six leadership pillars above, in order, plus one for Overall Leadership Effectiveness.
 
         REQUIREMENTS:
-        1. Each question must be HIGHLY SPECIFIC to their role, industry, and experience level
-        2. Questions should test different leadership competencies
-        3. Reference their actual work context and challenges
-        4. Use industry-specific terminology and situations
-        5. Consider cultural context from their country
-        6. Questions should feel personally relevant and challenging
-
-        Return ONLY valid JSON in this exact format:
-        [
-            {{"question": "Highly personalized question 1", "pillar": "Strategic Thinking"}},
-            {{"question": "Highly personalized question 2", "pillar": "Leading Change & Adaptability"}},
-            {{"question": "Highly personalized question 3", "pillar": "Effective Communication & Influence"}},
-            {{"question": "Highly personalized question 4", "pillar": "Empowerment & Motivation"}},
-            {{"question": "Highly personalized question 5", "pillar": "Responsibility & Accountability"}},
-            {{"question": "Highly personalized question 6", "pillar": "Innovation & Continuous Improvement"}},
-            {{"question": "Highly personalized question 7", "pillar": "Overall Leadership Effectiveness"}}
-        ]
-
-        CRITICAL: All content must be {lang_instruction}. No explanations, just the JSON.
+        1. Make each question specific to their role, industry, experience level and current challenges, using industry terminology
+        2. Consider cultural context from their country
+        3. Questions should feel personally relevant and challenging
+
+        Return a JSON array of exactly 7 items, each matching this schema:
+        {{"question": str, "pillar": str}}
         """
         
-        response_text = self._make_api_call_with_retry(prompt)
-        questions = self._clean_and_parse_json(response_text)
-        
-        # Validate response
+        return _compact_prompt(prompt)
+    
+    def _parse_yes_no_questions(self, response_text: str) -> List[Dict]:
+        """Parse and validate the Yes/No/Maybe questions response."""
+        try:
+            # JSON mode returns a bare document; markdown cleanup is only a fallback
+            questions = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            questions = self._clean_and_parse_json(response_text)
+        return self._validate_yes_no_questions(questions)
+    
+    def _validate_yes_no_questions(self, questions) -> List[Dict]:
+        """Validate a parsed list of Yes/No/Maybe questions."""
         if not isinstance(questions, list) or len(questions) != 7:
             raise Exception("Invalid question format - must be exactly 7 questions")
         
         for q in questions:
-            if not isinstance(q, dict) or 'question' not in q or 'pillar' not in q:
+            if not isinstance(q, dict):
                 raise Exception("Invalid question structure")
+            missing = _YES_NO_REQUIRED - q.keys()
+            if missing:
+                raise Exception(f"Invalid question structure - missing keys: {sorted(missing)}")
         
-        logger.info(f"Generated 7 comprehensive Yes/No/Maybe questions")
+        logger.info("Generated 7 comprehensive Yes/No/Maybe questions")
         return questions
     
-    def generate_comprehensive_mcq_questions(self, language: str, user_profile: Dict) -> List[Dict]:
-        """Generate 7 comprehensive MCQ questions covering all leadership scenarios."""
+    def generate_comprehensive_yes_no_questions(self, language: str, user_profile: Dict) -> List[Dict]:
+        """Generate 7 comprehensive Yes/No/Maybe questions covering all leadership pillars."""
+        return self._cached_api_call(
+            self._build_yes_no_prompt(language, user_profile), self._parse_yes_no_questions,
+            generation_config=YES_NO_GENERATION_CONFIG
+        )
+    
+    def _build_mcq_prompt(self, language: str, user_profile: Dict) -> str:
+        """Build the prompt for 7 comprehensive MCQ questions."""
         
         lang_instruction = "in Arabic language only" if language == 'ar' else "in English language only"
         
-        prompt = f"""
+        prompt = self._build_profile_context(user_profile) + f"""
         Create exactly 7 multiple choice questions for comprehensive leadership assessment {lang_instruction}, completely personalized for this professional.
 
-        PERSONALIZATION CONTEXT:
-        - Name: {user_profile.get('name')}
-        - Position: {user_profile.get('current_position')}
-        - Industry: {user_profile.get('industry')}
-        - Experience: {user_profile.get('experience_years')} years
-        - Leadership Experience: {user_profile.get('leadership_experience')} years
-        - Team Size: {user_profile.get('team_size')}
-        - Company Size: {user_profile.get('company_size')}
-
         REQUIREMENTS:
-        1. Each question must present a realistic scenario they would actually face in their role
-        2. Options must reflect real choices they would consider
-        3. Questions should test different leadership competencies comprehensively
-        4. Use industry-specific language and contexts
-        5. Difficulty appropriate for their experience level
-        6. Cover various leadership situations: crisis, growth, team conflicts, strategic decisions, etc.
-
-        Return ONLY valid JSON:
-        [
-            {{
-                "question": "Personalized scenario question 1",
-                "options": ["Option A", "Option B", "Option C", "Option D"],
-                "pillar": "Leadership competency being tested"
-            }},
-            {{
-                "question": "Personalized scenario question 2",
-                "options": ["Option A", "Option B", "Option C", "Option D"],
-                "pillar": "Leadership competency being tested"
-            }},
-            {{
-                "question": "Personalized scenario question 3",
-                "options": ["Option A", "Option B", "Option C", "Option D"],
-                "pillar": "Leadership competency being tested"
-            }},
-            {{
-                "question": "Personalized scenario question 4",
-                "options": ["Option A", "Option B", "Option C", "Option D"],
-                "pillar": "Leadership competency being tested"
-            }},
-            {{
-                "question": "Personalized scenario question 5",
-                "options": ["Option A", "Option B", "Option C", "Option D"],
-                "pillar": "Leadership competency being tested"
-            }},
-            {{
-                "question": "Personalized scenario question 6",
-                "options": ["Option A", "Option B", "Option C", "Option D"],
-                "pillar": "Leadership competency being tested"
-            }},
-            {{
-                "question": "Personalized scenario question 7",
-                "options": ["Option A", "Option B", "Option C", "Option D"],
-                "pillar": "Leadership competency being tested"
-            }}
-        ]
+        1. Each question presents a realistic situation from their role and industry, with 4 options reflecting real choices they would consider
+        2. Test a different leadership competency with each question, at a difficulty suited to their experience
+        3. Cover various situations: crisis, growth, team conflicts, strategic decisions
 
-        CRITICAL: All content must be {lang_instruction}.
+        Return a JSON array of exactly 7 items, each matching this schema:
+        {{"question": str, "options": [str, str, str, str], "pillar": str}}
         """
         
-        response_text = self._make_api_call_with_retry(prompt)
-        questions = self._clean_and_parse_json(response_text)
-        
-        # Validate response
+        return _compact_prompt(prompt)
+    
+    def _parse_mcq_questions(self, response_text: str) -> List[Dict]:
+        """Parse and validate the MCQ questions response."""
+        try:
+            # JSON mode returns a bare document; markdown cleanup is only a fallback
+            questions = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            questions = self._clean_and_parse_json(response_text)
+        return self._validate_mcq_questions(questions)
+    
+    def _validate_mcq_questions(self, questions) -> List[Dict]:
+        """Validate a parsed list of MCQ questions."""
         if not isinstance(questions, list) or len(questions) != 7:
             raise Exception("Invalid MCQ format - must be exactly 7 questions")
         
         for q in questions:
-            required_keys = ['question', 'options', 'pillar']
-            if not all(key in q for key in required_keys):
+            if not isinstance(q, dict):
                 raise Exception("Invalid MCQ structure")
+            missing = _MCQ_REQUIRED - q.keys()
+            if missing:
+                raise Exception(f"Invalid MCQ structure - missing keys: {sorted(missing)}")
             if len(q['options']) != 4:
                 raise Exception("MCQ must have exactly 4 options")
         
-        logger.info(f"Generated 7 comprehensive MCQ questions")
+        logger.info("Generated 7 comprehensive MCQ questions")
         return questions
     
-    def generate_personalized_scenario(self, language: str, user_profile: Dict) -> str:
-        """Generate a comprehensive personalized writing scenario."""
+    def generate_comprehensive_mcq_questions(self, language: str, user_profile: Dict) -> List[Dict]:
+        """Generate 7 comprehensive MCQ questions covering all leadership scenarios."""
+        return self._cached_api_call(
+            self._build_mcq_prompt(language, user_profile), self._parse_mcq_questions,
+            generation_config=MCQ_GENERATION_CONFIG
+        )
+    
+    def _build_scenario_prompt(self, language: str, user_profile: Dict) -> str:
+        """Build the prompt for a comprehensive personalized writing scenario."""
         
         lang_instruction = "in Arabic language only" if language == 'ar' else "in English language only"
         
-        prompt = f"""
+        prompt = self._build_profile_context(user_profile) + f"""
         Create one highly comprehensive, complex leadership scenario {lang_instruction} for this specific professional that requires detailed written analysis.
 
-        PERSONALIZATION CONTEXT:
-        - Name: {user_profile.get('name')}
-        - Position: {user_profile.get('current_position')}
-        - Industry: {user_profile.get('industry')}
-        - Experience: {user_profile.get('experience_years')} years
-        - Leadership Experience: {user_profile.get('leadership_experience')} years
-        - Team Size: {user_profile.get('team_size')}
-        - Company Size: {user_profile.get('company_size')}
-        - Country: {user_profile.get('country')}
-
         REQUIREMENTS:
-        1. Scenario must be HIGHLY SPECIFIC to their actual role and industry
-        2. Include multiple realistic stakeholders, constraints, and competing priorities
-        3. Test ALL leadership competencies simultaneously
-        4. Reflect current industry trends and challenges
-        5. Consider cultural and regional business context
-        6. Require 200-300 word response to address properly
-        7. Include specific metrics, timelines, budget constraints, and business outcomes
-        8. Present a complex situation with no obvious "right" answer
-        9. Require strategic thinking, change management, communication, team leadership, accountability, and innovation
-
-        Return ONLY the comprehensive scenario text {lang_instruction}. No formatting, explanations, or additional text.
+        1. Specific to their actual role, industry, current trends and regional business context
+        2. Multiple realistic stakeholders, constraints and competing priorities, with specific metrics, timelines, budget and business outcomes
+        3. No obvious "right" answer; addressing it must draw on all six pillars above and take a 200-300 word response
+
+        Return ONLY the scenario text, with no formatting or additional text.
         """
         
-        scenario = self._make_api_call_with_retry(prompt)
-        
-        # Validate scenario length and content
+        return _compact_prompt(prompt)
+    
+    def _validate_scenario(self, scenario: str) -> str:
+        """Validate the generated scenario length and content."""
         if len(scenario) < 150:
             raise Exception("Generated scenario too short")
         
         logger.info("Generated comprehensive personalized scenario question")
         return scenario
     
-    def generate_comprehensive_detailed_report(self, responses: Dict, language: str, user_profile: Dict) -> Dict:
-        """Generate comprehensive detailed report based on all responses using the enhanced prompt."""
+    def generate_personalized_scenario(self, language: str, user_profile: Dict,
+                                       on_chunk: Optional[Callable[[str], None]] = None) -> str:
+        """Generate a comprehensive personalized writing scenario, optionally streaming new text chunks to on_chunk."""
+        prompt = self._build_scenario_prompt(language, user_profile)
+        fetch = None
+        if on_chunk is not None:
+            fetch = lambda: self._stream_text(prompt, on_chunk)
+        return self._cached_api_call(prompt, self._validate_scenario, fetch=fetch)
+    
+    async def _generate_assessment_content_async(self, language: str, user_profile: Dict) -> Dict:
+        """Run the three question-generation calls concurrently."""
+        yes_no_text, mcq_text, scenario_text = await asyncio.gather(
+            self._make_api_call_async(
+                self._build_yes_no_prompt(language, user_profile), generation_config=YES_NO_GENERATION_CONFIG
+            ),
+            self._make_api_call_async(
+                self._build_mcq_prompt(language, user_profile), generation_config=MCQ_GENERATION_CONFIG
+            ),
+            self._make_api_call_async(self._build_scenario_prompt(language, user_profile))
+        )
+        
+        return {
+            'yes_no_questions': self._parse_yes_no_questions(yes_no_text),
+            'mcq_questions': self._parse_mcq_questions(mcq_text),
+            'scenario_question': self._validate_scenario(scenario_text)
+        }
+    
+    def _build_full_assessment_prompt(self, language: str, user_profile: Dict) -> str:
+        """Build one prompt that returns all 7+7+1 assessment parts together."""
+        
+        lang_instruction = "in Arabic language only" if language == 'ar' else "in English language only"
+        
+        prompt = self._build_profile_context(user_profile) + f"""
+        You are an expert leadership psychologist creating a complete personalized leadership assessment {lang_instruction}. Generate all three parts below in a single JSON object.
+
+        PART 1 - "yes_no": exactly 7 unique Yes/No/Maybe questions, one for each of the six leadership pillars above, in order, plus one for Overall Leadership Effectiveness.
+        1. Each question must be HIGHLY SPECIFIC to their role, industry, and experience level
+        2. Reference their actual work context and challenges using industry-specific terminology
+        3. Consider cultural context from their country
+
+        PART 2 - "mcq": exactly 7 multiple choice questions, each a realistic scenario they would actually face in their role, with exactly 4 options reflecting real choices they would consider.
+        1. Test different leadership competencies comprehensively
+        2. Cover various leadership situations: crisis, growth, team conflicts, strategic decisions, etc.
+        3. Difficulty appropriate for their experience level
+
+        PART 3 - "scenario": one highly comprehensive, complex leadership scenario that requires a 200-300 word written response.
+        1. Include multiple realistic stakeholders, constraints, and competing priorities
+        2. Include specific metrics, timelines, budget constraints, and business outcomes
+        3. Present a complex situation with no obvious "right" answer that tests ALL leadership competencies
+
+        Return a JSON object matching this schema:
+        {{"yes_no": [{{"question": str, "pillar": str}}], "mcq": [{{"question": str, "options": [str, str, str, str], "pillar": str}}], "scenario": str}}
+        """
+        
+        return _compact_prompt(prompt)
+    
+    def generate_all_questions(self, language: str, user_profile: Dict) -> Dict:
+        """Generate the 7 Y/N, 7 MCQ and 1 scenario questions with a single API call."""
+        return self._cached_api_call(
+            self._build_full_assessment_prompt(language, user_profile), self._parse_full_assessment,
+            generation_config=FULL_ASSESSMENT_GENERATION_CONFIG
+        )
+    
+    def _parse_full_assessment(self, response_text: str) -> Dict:
+        """Parse and validate the combined 7+7+1 response."""
+        try:
+            content = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            content = self._clean_and_parse_json(response_text)
+        
+        if not isinstance(content, dict):
+            raise Exception("Invalid assessment format - expected a JSON object")
+        
+        return {
+            'yes_no_questions': self._validate_yes_no_questions(content.get('yes_no')),
+            'mcq_questions': self._validate_mcq_questions(content.get('mcq')),
+            'scenario_question': self._validate_scenario(str(content.get('scenario', '')).strip())
+        }
+    
+    def generate_assessment_content(self, language: str, user_profile: Dict) -> Dict:
+        """Generate all 7+7+1 assessment questions, in one call when possible."""
+        try:
+            return self.generate_all_questions(language, user_profile)
+        except Exception as e:
+            # Fall back to the three individual prompts, issued concurrently
+            logger.warning("Single-call assessment generation failed: %s", e)
+            return asyncio.run_coroutine_threadsafe(
+                self._generate_assessment_content_async(language, user_profile), get_event_loop()
+            ).result()
+    
+    def generate_comprehensive_detailed_report(self, responses: Dict, language: str, user_profile: Dict,
+                                               on_chunk: Optional[Callable[[str], None]] = None) -> Dict:
+        """Generate comprehensive detailed report based on all responses, optionally streaming new text chunks to on_chunk."""
         
         lang_instruction = "English" if language == 'en' else "Arabic"
         
         # Prepare detailed response analysis
-        response_analysis = ""
-        for key, value in responses.items():
-            response_analysis += f"\n{key}: {json.dumps(value, ensure_ascii=False)}"
+        response_analysis = "\n".join(
+            f"{key}: {orjson.dumps(value).decode()}"
+            for key, value in responses.items()
+        )
         
+        # Static instructions and schema first, per-user profile and responses last,
+        # so the long prefix is byte-identical across users of the same language
         prompt = f"""
         Role: You are a highly experienced and meticulous Senior Leadership Consultant, specializing in AI-driven behavioral analysis and human potential development. Your task is to generate a full, highly detailed, and actionable leadership assessment report based exclusively on the provided user profile and their actual, verbatim responses to the assessment questions.
 
         Goal: To provide the user with a report so thorough and insightful that it serves as a personalized coaching document, justifying every score, strength, and development area with direct references to their responses.
 
-        Input:
-        User Profile:
-        {json.dumps(user_profile, indent=2, ensure_ascii=False)}
-
-        User Responses (Verbatim):
-        {response_analysis}
-
         Language of Report: {lang_instruction}
 
         The output MUST be a single, valid JSON object following this exact structure. All textual content within the JSON must be in {lang_instruction}.
 
         {{
-          "report_title": "Personalized Leadership Assessment Report for {user_profile.get('name')}",
+          "report_title": "Personalized Leadership Assessment Report for [the user's name]",
           "executive_summary": "A 3-5 paragraph executive summary. Focus on the most salient strengths and development areas from their responses, and the overall leadership style demonstrated.",
 
           "overall_leadership_score": {{
@@ -891,16 +1188,13 @@ class DynamicLeadershipAssessment:
 
           "personal_development_plan": {{
             "30_day_goals": [
-              "Specific, measurable goal 1 (e.g., 'Identify 3 opportunities to delegate tasks to direct reports and empower them in decision-making, as noted in your scenario response hesitation regarding delegation.').",
-              "Specific, measurable goal 2."
+              "Specific, measurable goal (e.g., 'Identify 3 opportunities to delegate tasks to direct reports and empower them in decision-making, as noted in your scenario response hesitation regarding delegation.')."
             ],
             "90_day_goals": [
-              "Specific, measurable goal 1 (e.g., 'Lead a small change initiative, focusing on proactive communication and addressing team concerns, building on your Y/N answer patterns showing hesitancy towards direct confrontation in change.').",
-              "Specific, measurable goal 2."
+              "Specific, measurable goal (e.g., 'Lead a small change initiative, focusing on proactive communication and addressing team concerns, building on your Y/N answer patterns showing hesitancy towards direct confrontation in change.')."
             ],
             "6_month_goals": [
-              "Specific, measurable goal 1 (e.g., 'Develop and present a strategic proposal to senior management, incorporating detailed data analysis and stakeholder mapping, to enhance your strategic thinking skills identified in the MCQ challenges.').",
-              "Specific, measurable goal 2."
+              "Specific, measurable goal (e.g., 'Develop and present a strategic proposal to senior management, incorporating detailed data analysis and stakeholder mapping, to enhance your strategic thinking skills identified in the MCQ challenges.')."
             ]
           }},
 
@@ -917,108 +1211,57 @@ class DynamicLeadershipAssessment:
         - NO GUESSWORK: If a specific behavior cannot be inferred from the responses, state that the information is insufficient for a conclusive assessment in that specific area, rather than fabricating.
         - COHERENCE: Ensure the entire report flows logically, with insights building upon each other.
         - PROFESSIONAL TONE: Maintain a supportive, analytical, and encouraging tone throughout.
+        - GOALS: Give 2 goals for each timeframe in personal_development_plan.
+
+        Input:
+        """ + self._build_profile_context(user_profile) + f"""
+        User Responses (Verbatim):
+        {response_analysis}
         """
+        prompt = _compact_prompt(prompt)
         
+        # Not disk-cached: the prompt carries the user's profile and verbatim answers
         try:
-            response_text = self._make_api_call_with_retry(prompt)
-            logger.info(f"Raw detailed report response: {response_text[:500]}...")
-            
-            detailed_report = self._clean_and_parse_json(response_text)
-            
-            # Validate the detailed report structure
-            required_keys = [
-                'report_title', 'executive_summary', 'overall_leadership_score',
-                'leadership_profile_breakdown', 'overall_strengths', 'overall_development_areas',
-                'detailed_insights_from_response_types', 'personalized_recommendations',
-                'personal_development_plan', 'cultural_and_industry_nuances', 'closing_remarks'
-            ]
-            
-            for key in required_keys:
-                if key not in detailed_report:
-                    logger.warning(f"Missing key in detailed report: {key}")
-                    detailed_report[key] = f"Analysis for {key} not available"
-            
-            # Validate scores in the detailed report
-            if 'overall_leadership_score' in detailed_report and 'score' in detailed_report['overall_leadership_score']:
-                score = detailed_report['overall_leadership_score']['score']
-                if not isinstance(score, (int, float)) or not (1.0 <= score <= 10.0):
-                    detailed_report['overall_leadership_score']['score'] = 7.0
-            
-            # Validate pillar scores
-            if 'leadership_profile_breakdown' in detailed_report:
-                for pillar in CONTENT['en']['pillars']:
-                    if pillar in detailed_report['leadership_profile_breakdown']:
-                        pillar_data = detailed_report['leadership_profile_breakdown'][pillar]
-                        if 'score' in pillar_data:
-                            score = pillar_data['score']
-                            if not isinstance(score, (int, float)) or not (1.0 <= score <= 10.0):
-                                pillar_data['score'] = 7.0
-            
-            logger.info("Generated comprehensive detailed leadership report")
-            return detailed_report
-            
-        except Exception as e:
-            logger.error(f"Detailed report generation failed: {str(e)}")
-            raise
-    
-    def generate_enhanced_pdf_report(self, report_data: Dict, user_profile: Dict, language: str) -> bytes:
-        """Generate enhanced PDF with Arabic font support."""
-        try:
-            pdf_gen = ArabicFontPDFGenerator(language)
-            
-            # Add title
-            if language == 'ar':
-                pdf_gen.add_title("تقرير تقييم القيادة الشخصي")
-            else:
-                pdf_gen.add_title("Personal Leadership Assessment Report")
-            
-            # Add user information
-            if language == 'ar':
-                pdf_gen.add_section("معلومات المستخدم", [
-                    f"الاسم: {user_profile.get('name', 'غير متوفر')}",
-                    f"المنصب: {user_profile.get('current_position', 'غير متوفر')}",
-                    f"الصناعة: {user_profile.get('industry', 'غير متوفر')}",
-                    f"سنوات الخبرة: {user_profile.get('experience_years', 'غير متوفر')} سنة",
-                    f"تاريخ الإنشاء: {datetime.now().strftime('%Y/%m/%d')}"
-                ])
-            else:
-                pdf_gen.add_section("User Information", [
-                    f"Name: {user_profile.get('name', 'N/A')}",
-                    f"Position: {user_profile.get('current_position', 'N/A')}",
-                    f"Industry: {user_profile.get('industry', 'N/A')}",
-                    f"Experience: {user_profile.get('experience_years', 'N/A')} years",
-                    f"Generated: {datetime.now().strftime('%B %d, %Y')}"
-                ])
-            
-            # Add executive summary
-            if language == 'ar':
-                pdf_gen.add_section("الملخص التنفيذي", report_data.get('executive_summary', 'الملخص التنفيذي غير متوفر.'))
-            else:
-                pdf_gen.add_section("Executive Summary", report_data.get('executive_summary', 'Executive summary not available.'))
-            
-            # Add overall score
-            overall_score_data = report_data.get('overall_leadership_score', {})
-            overall_score = overall_score_data.get('score', 0)
-            
-            if language == 'ar':
-                pdf_gen.add_section(f"النتيجة الإجمالية للقيادة: {overall_score:.1f}/10", 
-                                  overall_score_data.get('justification', 'المبرر غير متوفر.'))
+            if on_chunk is None:
+                response_text = self._make_api_call_with_retry(prompt, generation_config=REPORT_GENERATION_CONFIG)
             else:
-                pdf_gen.add_section(f"Overall Leadership Score: {overall_score:.1f}/10", 
-                                  overall_score_data.get('justification', 'Score justification not available.'))
-            
-            # Add other sections...
-            pdf_bytes = pdf_gen.generate_pdf()
-            return pdf_bytes
-            
+                response_text = self._stream_text(prompt, on_chunk, generation_config=REPORT_GENERATION_CONFIG)
+            return self._parse_detailed_report(response_text)
         except Exception as e:
-            logger.error(f"Enhanced PDF generation error: {str(e)}")
-            raise Exception(f"Failed to generate enhanced PDF: {str(e)}")
+            logger.error("Detailed report generation failed: %s", e)
+            raise
     
-    def generate_html_report(self, report_data: Dict, user_profile: Dict, language: str) -> str:
-        """Generate HTML report for browser printing."""
-        html_gen = HTMLReportGenerator(language)
-        return html_gen.generate_html_report(report_data, user_profile)
+    def _parse_detailed_report(self, response_text: str) -> Dict:
+        """Parse the detailed report, filling missing sections and clamping out-of-range scores."""
+        logger.info("Raw detailed report response: %.500s...", response_text)
+        
+        detailed_report = self._clean_and_parse_json(response_text)
+        
+        # Validate the detailed report structure
+        missing = _REPORT_REQUIRED - detailed_report.keys()
+        if missing:
+            logger.warning("Missing keys in detailed report: %s", sorted(missing))
+            for key in missing:
+                detailed_report[key] = f"Analysis for {key} not available"
+        
+        # Validate scores in the detailed report
+        if 'overall_leadership_score' in detailed_report and 'score' in detailed_report['overall_leadership_score']:
+            score = detailed_report['overall_leadership_score']['score']
+            if not _score_in_range(score):
+                detailed_report['overall_leadership_score']['score'] = 7.0
+        
+        # Validate pillar scores
+        if 'leadership_profile_breakdown' in detailed_report:
+            for pillar in CONTENT['en']['pillars']:
+                if pillar in detailed_report['leadership_profile_breakdown']:
+                    pillar_data = detailed_report['leadership_profile_breakdown'][pillar]
+                    if 'score' in pillar_data:
+                        score = pillar_data['score']
+                        if not _score_in_range(score):
+                            pillar_data['score'] = 7.0
+        
+        logger.info("Generated comprehensive detailed leadership report")
+        return detailed_report
 
 # Session state management
 def initialize_session_state():
@@ -1032,6 +1275,7 @@ def initialize_session_state():
         'scenario_question': "",
         'responses': {},
         'detailed_report': {},
+        'report_source': None,
         'assessment_engine': None,
         'start_time': None,
         'current_question_index': 0
@@ -1041,18 +1285,98 @@ def initialize_session_state():
         if key not in st.session_state:
             st.session_state[key] = default_value
 
+@st.cache_resource
+def get_engine() -> DynamicLeadershipAssessment:
+    """Create the assessment engine once per server process, shared by all sessions."""
+    return DynamicLeadershipAssessment()
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """One long-lived event loop for async Gemini calls, run on a daemon thread and shared by all sessions."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="gemini-async", daemon=True).start()
+    return loop
+
 def check_api_connection():
     """Check and initialize API connection."""
     try:
         if st.session_state.assessment_engine is None:
             with st.spinner("Initializing AI Assessment Engine..."):
-                st.session_state.assessment_engine = DynamicLeadershipAssessment()
+                st.session_state.assessment_engine = get_engine()
         return True
     except Exception as e:
         st.error(f"Failed to initialize assessment engine: {str(e)}")
-        logger.error(f"API initialization failed: {str(e)}")
+        logger.error("API initialization failed: %s", e)
         return False
 
+# Cross-user question cache
+def _experience_bucket(years) -> str:
+    """Bucket years of experience so comparable profiles share a cache entry."""
+    try:
+        years = int(years)
+    except (TypeError, ValueError):
+        return 'unknown'
+    for upper, label in ((2, '0-2'), (5, '3-5'), (10, '6-10'), (20, '11-20')):
+        if years <= upper:
+            return label
+    return '20+'
+
+def _age_bucket(age) -> str:
+    """Bucket age by decade so comparable profiles share a cache entry."""
+    try:
+        decade = int(age) // 10 * 10
+    except (TypeError, ValueError):
+        return 'unknown'
+    return f"{decade}-{decade + 9}"
+
+# Stands in for the user's name in shared content; replaced per user on the way out
+SHARED_NAME_PLACEHOLDER = "[NAME]"
+
+def _shared_profile(user_profile: Dict) -> Dict:
+    """Reduce a profile to its structural parts, so shared content carries nothing personal."""
+    return {
+        'name': SHARED_NAME_PLACEHOLDER,
+        'current_position': str(user_profile.get('current_position', '')).strip().lower(),
+        'industry': user_profile.get('industry'),
+        'experience_years': _experience_bucket(user_profile.get('experience_years')),
+        'leadership_experience': _experience_bucket(user_profile.get('leadership_experience')),
+        'team_size': user_profile.get('team_size'),
+        'company_size': user_profile.get('company_size'),
+        'country': str(user_profile.get('country', '')).strip().lower(),
+        'age': _age_bucket(user_profile.get('age')),
+        'education': user_profile.get('education'),
+        'current_challenges': "Not provided"
+    }
+
+@st.cache_data(ttl=86400, max_entries=256, show_spinner=False)
+def _shared_assessment_content(language: str, shared_items: tuple) -> Dict:
+    """Assessment content for one anonymised profile bucket, shared across sessions."""
+    return get_engine().generate_assessment_content(language, dict(shared_items))
+
+def get_assessment_content(language: str, user_profile: Dict) -> Dict:
+    """Return assessment content for a profile, reusing questions from a similar profile."""
+    # Stated challenges are free text that shapes the questions, so such profiles
+    # get their own content (repeats are still served by the response cache)
+    if str(user_profile.get('current_challenges') or '').strip():
+        return get_engine().generate_assessment_content(language, user_profile)
+    shared_items = tuple(sorted(_shared_profile(user_profile).items()))
+    content_json = orjson.dumps(_shared_assessment_content(language, shared_items)).decode()
+    # Fill in the user's name, escaped as it appears inside JSON strings
+    name = orjson.dumps(str(user_profile.get('name', '')).strip()).decode()[1:-1]
+    return orjson.loads(content_json.replace(SHARED_NAME_PLACEHOLDER, name))
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _build_pdf(report_json: str, profile_json: str, language: str) -> bytes:
+    """Build the PDF once per report, profile and language and reuse the bytes for repeat downloads."""
+    # Imported here so reportlab loads on the first PDF request, not at startup
+    import pdf_report
+    return pdf_report.render_pdf(report_json, profile_json, language)
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _build_html(report_json: str, profile_json: str, language: str) -> str:
+    """Render the printable HTML report once per report, profile and language."""
+    return HTMLReportGenerator(language).generate_html_report(orjson.loads(report_json), orjson.loads(profile_json))
+
 def display_language_selector():
     """Display language selector."""
     with st.sidebar:
@@ -1077,42 +1401,9 @@ def display_welcome():
     st.title(content['title'])
     st.subheader(content['subtitle'])
     
-    if lang == 'ar':
-        st.markdown("""
-        ### 🚀 نظام تقييم قيادي ديناميكي شامل
-        
-        **هيكل التقييم:**
-        - **7 أسئلة نعم/لا/ربما**: تغطي جميع أركان القيادة
-        - **7 أسئلة متعددة الخيارات**: سيناريوهات قيادية متنوعة
-        - **1 سيناريو كتابي**: تحليل قيادي شامل ومعمق
-        
-        **المميزات:**
-        - لا توجد أسئلة محددة مسبقاً
-        - تحليل شخصي مبني على إجاباتك الفعلية
-        - تقرير PDF باللغة العربية (محسّن ومطور)
-        - خطة تطوير مخصصة لدورك ومجالك
-        
-        ✅ **محرك الذكاء الاصطناعي جاهز للتقييم الشامل**
-        """)
-    else:
-        st.markdown("""
-        ### 🚀 Comprehensive Dynamic Leadership Assessment System
-        
-        **Assessment Structure:**
-        - **7 Yes/No/Maybe Questions**: Covering all leadership pillars
-        - **7 Multiple Choice Questions**: Diverse leadership scenarios
-        - **1 Writing Scenario**: Comprehensive leadership analysis
-        
-        **Features:**
-        - No Predefined Questions
-        - Personalized Analysis based on actual responses
-        - Enhanced PDF Report with Multiple Arabic Solutions
-        - Custom Development Plan for your role and industry
-        
-        ✅ **AI Engine Ready for Comprehensive Assessment**
-        """)
+    st.markdown(WELCOME_TEXT[lang])
     
-    st.success("🤖 Dynamic AI Assessment (7+7+1): Ready" if lang == 'en' else "🤖 التقييم الذكي الديناميكي (7+7+1): جاهز")
+    st.success(content['engine_ready'])
     
     if st.button(content['begin_assessment'], type="primary", use_container_width=True):
         st.session_state.assessment_phase = 'profile'
@@ -1130,58 +1421,45 @@ def display_user_profile():
     with st.form("dynamic_profile_form"):
         col1, col2 = st.columns(2)
         
-        # Dynamic industry options
-        industry_options = {
-            'en': ["Technology", "Healthcare", "Finance", "Education", "Manufacturing", 
-                   "Retail", "Consulting", "Government", "Non-profit", "Energy", 
-                   "Telecommunications", "Media", "Real Estate", "Other"],
-            'ar': ["التكنولوجيا", "الرعاية الصحية", "المالية", "التعليم", "التصنيع",
-                   "التجارة", "الاستشارات", "الحكومة", "غير ربحي", "الطاقة",
-                   "الاتصالات", "الإعلام", "العقارات", "أخرى"]
-        }
-        
         with col1:
-            name = st.text_input("Full Name *" if lang == 'en' else "الاسم الكامل *")
-            age = st.number_input("Age *" if lang == 'en' else "العمر *", min_value=18, max_value=80, value=30)
-            experience_years = st.number_input("Years of Experience *" if lang == 'en' else "سنوات الخبرة *", min_value=0, max_value=50, value=5)
-            current_position = st.text_input("Current Position *" if lang == 'en' else "المنصب الحالي *")
-            industry = st.selectbox("Industry *" if lang == 'en' else "الصناعة *", industry_options[lang])
+            name = st.text_input(content['field_name'])
+            age = st.number_input(content['field_age'], min_value=18, max_value=80, value=30)
+            experience_years = st.number_input(content['field_experience'], min_value=0, max_value=50, value=5)
+            current_position = st.text_input(content['field_position'])
+            industry = st.selectbox(content['field_industry'], INDUSTRY_OPTIONS[lang])
             
         with col2:
-            country = st.text_input("Country *" if lang == 'en' else "البلد *")
+            country = st.text_input(content['field_country'])
             team_size = st.selectbox(
-                "Team Size" if lang == 'en' else "حجم الفريق",
-                ["No direct reports", "1-5", "6-15", "16-50", "50+"] if lang == 'en' else 
-                ["لا يوجد مرؤوسين", "1-5", "6-15", "16-50", "أكثر من 50"]
+                content['field_team_size'],
+                TEAM_SIZE_OPTIONS[lang]
             )
-            leadership_experience = st.number_input("Leadership Experience (years)" if lang == 'en' else "الخبرة القيادية (سنوات)", min_value=0, max_value=40, value=2)
+            leadership_experience = st.number_input(content['field_leadership_experience'], min_value=0, max_value=40, value=2)
             company_size = st.selectbox(
-                "Company Size" if lang == 'en' else "حجم الشركة",
-                ["Startup (1-50)", "Small (51-200)", "Medium (201-1000)", "Large (1001-5000)", "Enterprise (5000+)"] if lang == 'en' else
-                ["ناشئة (1-50)", "صغيرة (51-200)", "متوسطة (201-1000)", "كبيرة (1001-5000)", "مؤسسة (5000+)"]
+                content['field_company_size'],
+                COMPANY_SIZE_OPTIONS[lang]
             )
             education = st.selectbox(
-                "Education Level" if lang == 'en' else "المستوى التعليمي",
-                ["High School", "Bachelor's", "Master's", "PhD", "Professional Cert"] if lang == 'en' else
-                ["ثانوية", "بكالوريوس", "ماجستير", "دكتوراه", "شهادة مهنية"]
+                content['field_education'],
+                EDUCATION_OPTIONS[lang]
             )
         
         # Additional context for personalization
-        st.markdown("### " + ("Additional Context" if lang == 'en' else "سياق إضافي"))
+        st.markdown(content['additional_context'])
         current_challenges = st.text_area(
-            "Current leadership challenges you face:" if lang == 'en' else "التحديات القيادية الحالية التي تواجهها:",
-            placeholder="Describe specific challenges in your role..." if lang == 'en' else "صف التحديات المحددة في دورك..."
+            content['challenges_label'],
+            placeholder=content['challenges_placeholder']
         )
         
         submitted = st.form_submit_button(
-            "Generate 7+7+1 Assessment" if lang == 'en' else "إنشاء التقييم 7+7+1",
+            content['generate_assessment'],
             type="primary", use_container_width=True
         )
         
         if submitted:
             required_fields = [name, current_position, industry, country]
             if not all(required_fields):
-                st.error("Please fill all required fields" if lang == 'en' else "يرجى ملء جميع الحقول المطلوبة")
+                st.error(content['fill_required'])
             else:
                 st.session_state.user_profile = {
                     "name": name, "age": age, "experience_years": experience_years,
@@ -1190,8 +1468,20 @@ def display_user_profile():
                     "company_size": company_size, "education": education,
                     "current_challenges": current_challenges
                 }
+                
+                # Generate all three parts concurrently so later phases skip the network
+                with st.spinner(content['profile_spinner']):
+                    try:
+                        assessment_content = get_assessment_content(lang, st.session_state.user_profile)
+                        st.session_state.yes_no_questions = assessment_content['yes_no_questions']
+                        st.session_state.mcq_questions = assessment_content['mcq_questions']
+                        st.session_state.scenario_question = assessment_content['scenario_question']
+                    except Exception as e:
+                        # Each phase falls back to generating its own questions
+                        logger.warning("Concurrent assessment generation failed: %s", e)
+                
                 st.session_state.assessment_phase = 'yes_no'
-                st.success("Profile saved! Generating 7 personalized Yes/No questions..." if lang == 'en' else "تم حفظ الملف الشخصي! جاري إنشاء 7 أسئلة نعم/لا شخصية...")
+                st.success(content['profile_saved'])
                 st.rerun()
 
 def display_yes_no_assessment():
@@ -1199,174 +1489,253 @@ def display_yes_no_assessment():
     lang = st.session_state.language
     content = CONTENT[lang]
     
-    st.header("📋 Part 1: Yes/No/Maybe Questions (7 Questions)" if lang == 'en' else "📋 الجزء الأول: أسئلة نعم/لا/ربما (7 أسئلة)")
-    st.info("Comprehensive questions covering all leadership competencies" if lang == 'en' else "أسئلة شاملة تغطي جميع الكفاءات القيادية")
+    st.header(content['yn_header'])
+    st.info(content['yn_info'])
     
     # Generate 7 comprehensive questions
     if not st.session_state.yes_no_questions:
-        with st.spinner("🤖 AI is creating 7 personalized Yes/No questions..." if lang == 'en' else "🤖 الذكاء الاصطناعي ينشئ 7 أسئلة نعم/لا شخصية..."):
+        with st.spinner(content['yn_spinner']):
             try:
-                questions = st.session_state.assessment_engine.generate_comprehensive_yes_no_questions(
-                    lang, st.session_state.user_profile
-                )
+                # Repeat profiles are served by the engine's on-disk response cache
+                questions = get_engine().generate_comprehensive_yes_no_questions(lang, st.session_state.user_profile)
                 st.session_state.yes_no_questions = questions
-                st.success("✨ 7 personalized questions generated!" if lang == 'en' else "✨ تم إنشاء 7 أسئلة شخصية!")
+                st.success(content['yn_success'])
             except Exception as e:
                 st.error(f"Failed to generate questions: {str(e)}")
                 return
     
     # Display all 7 questions
-    yes_no_responses = st.session_state.responses.get('yes_no', {})
-    
-    for i, q in enumerate(st.session_state.yes_no_questions):
-        st.markdown(f"**{i+1}. {q['question']}**")
-        st.caption(f"Testing: {q['pillar']}")
+    # Bound to the stored dict, so answers written below need no reassignment
+    yes_no_responses = st.session_state.responses.setdefault('yes_no', {})
+    options = [content['yes'], content['no'], content['maybe']]
+    idx_map = {option: k for k, option in enumerate(options)}
+    
+    st.markdown(QUESTION_SEPARATOR_CSS, unsafe_allow_html=True)
+    
+    # A form so answering the radios does not rerun the script until Continue is pressed
+    with st.form("yn_form"):
+        for i, q in enumerate(st.session_state.yes_no_questions):
+            st.markdown(f"**{i+1}. {q['question']}**")
+            st.caption(f"Testing: {q['pillar']}")
+            
+            response = st.radio(
+                content['yn_answer_label'],
+                options,
+                key=f"yn_{i}",
+                index=idx_map.get(yes_no_responses.get(f'q{i}'), 0)
+            )
+            yes_no_responses[f'q{i}'] = response
         
-        response = st.radio(
-            "Your answer:" if lang == 'en' else "إجابتك:",
-            [content['yes'], content['no'], content['maybe']],
-            key=f"yn_{i}",
-            index=0 if f'q{i}' not in yes_no_responses else [content['yes'], content['no'], content['maybe']].index(yes_no_responses[f'q{i}'])
-        )
-        yes_no_responses[f'q{i}'] = response
-        st.markdown("---")
-    
-    st.session_state.responses['yes_no'] = yes_no_responses
-    
-    # Progress indicator
-    st.progress(1/3, text="Progress: Part 1 of 3 completed" if lang == 'en' else "التقدم: الجزء 1 من 3 مكتمل")
+        # Progress indicator
+        st.progress(1/3, text=content['yn_progress'])
+        
+        # Navigation
+        submitted = st.form_submit_button(content['yn_continue'], type="primary", use_container_width=True)
     
-    # Navigation
-    if st.button("Continue to Multiple Choice Questions (7 Questions)" if lang == 'en' else "المتابعة للأسئلة متعددة الخيارات (7 أسئلة)", type="primary", use_container_width=True):
+    if submitted:
         st.session_state.assessment_phase = 'mcq'
         st.rerun()
 
 def display_mcq_assessment():
     """Display 7 MCQ questions."""
     lang = st.session_state.language
+    content = CONTENT[lang]
     
-    st.header("📋 Part 2: Multiple Choice Questions (7 Questions)" if lang == 'en' else "📋 الجزء الثاني: أسئلة متعددة الخيارات (7 أسئلة)")
-    st.info("Complex scenarios tailored to your role and industry" if lang == 'en' else "سيناريوهات معقدة مصممة لدورك ومجالك")
+    st.header(content['mcq_header'])
+    st.info(content['mcq_info'])
     
     # Generate 7 comprehensive MCQ questions
     if not st.session_state.mcq_questions:
-        with st.spinner("🤖 Creating 7 personalized scenario questions..." if lang == 'en' else "🤖 إنشاء 7 أسئلة سيناريو شخصية..."):
+        with st.spinner(content['mcq_spinner']):
             try:
-                mcq_questions = st.session_state.assessment_engine.generate_comprehensive_mcq_questions(
-                    lang, st.session_state.user_profile
-                )
+                mcq_questions = get_engine().generate_comprehensive_mcq_questions(lang, st.session_state.user_profile)
                 st.session_state.mcq_questions = mcq_questions
-                st.success("✨ 7 personalized scenarios ready!" if lang == 'en' else "✨ 7 سيناريوهات شخصية جاهزة!")
+                st.success(content['mcq_success'])
             except Exception as e:
                 st.error(f"Failed to generate MCQ questions: {str(e)}")
                 return
     
     # Display all 7 MCQ questions
-    mcq_responses = st.session_state.responses.get('mcq', {})
-    
-    for i, q in enumerate(st.session_state.mcq_questions):
-        st.markdown(f"**{i+1}. {q['question']}**")
-        st.caption(f"Testing: {q['pillar']}")
-        
-        response = st.radio(
-            "Select your approach:" if lang == 'en' else "اختر نهجك:",
-            q['options'],
-            key=f"mcq_{i}",
-            index=0 if f'q{i}' not in mcq_responses else q['options'].index(mcq_responses[f'q{i}'])
-        )
-        mcq_responses[f'q{i}'] = response
-        st.markdown("---")
+    # Bound to the stored dict, so answers written below need no reassignment
+    mcq_responses = st.session_state.responses.setdefault('mcq', {})
     
-    st.session_state.responses['mcq'] = mcq_responses
+    st.markdown(QUESTION_SEPARATOR_CSS, unsafe_allow_html=True)
     
-    # Progress indicator
-    st.progress(2/3, text="Progress: Part 2 of 3 completed" if lang == 'en' else "التقدم: الجزء 2 من 3 مكتمل")
+    # A form so answering the radios does not rerun the script until a navigation button is pressed
+    with st.form("mcq_form"):
+        for i, q in enumerate(st.session_state.mcq_questions):
+            st.markdown(f"**{i+1}. {q['question']}**")
+            st.caption(f"Testing: {q['pillar']}")
+            
+            # Options differ per question, so the lookup map is built per question
+            idx_map = {option: k for k, option in enumerate(q['options'])}
+            response = st.radio(
+                content['mcq_answer_label'],
+                q['options'],
+                key=f"mcq_{i}",
+                index=idx_map.get(mcq_responses.get(f'q{i}'), 0)
+            )
+            mcq_responses[f'q{i}'] = response
+        
+        # Progress indicator
+        st.progress(2/3, text=content['mcq_progress'])
+        
+        # Navigation; both buttons submit the form so answers are kept either way
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            back = st.form_submit_button(content['mcq_back'], use_container_width=True)
+        
+        with col2:
+            proceed = st.form_submit_button(content['mcq_continue'], type="primary", use_container_width=True)
     
-    # Navigation
-    col1, col2 = st.columns(2)
+    if back:
+        st.session_state.assessment_phase = 'yes_no'
+        st.rerun()
+    elif proceed:
+        st.session_state.assessment_phase = 'scenario'
+        st.rerun()
+
+@st.fragment
+def _scenario_response_input(content):
+    """Render the scenario response box and its word-count guidance."""
+    response = st.text_area(
+        content['scenario_response_label'],
+        value=st.session_state.responses.get('scenario', ''),
+        height=300,
+        placeholder=content['scenario_placeholder']
+    )
     
-    with col1:
-        if st.button("⬅️ Back to Yes/No Questions" if lang == 'en' else "⬅️ العودة لأسئلة نعم/لا", use_container_width=True):
-            st.session_state.assessment_phase = 'yes_no'
-            st.rerun()
+    st.session_state.responses['scenario'] = response
     
-    with col2:
-        if st.button("Continue to Writing Scenario (1 Question)" if lang == 'en' else "المتابعة لسيناريو الكتابة (سؤال واحد)", type="primary", use_container_width=True):
-            st.session_state.assessment_phase = 'scenario'
-            st.rerun()
+    # Word count and guidance; only re-split when the text actually changed
+    if st.session_state.get('wc_text') != response:
+        st.session_state.wc_text = response
+        st.session_state.wc_count = len(response.split()) if response else 0
+    word_count = st.session_state.wc_count
+    bucket = 0 if word_count < 100 else 1 if word_count < 200 else 2
+    notice, message_key = WORD_COUNT_NOTICES[bucket]
+    getattr(st, notice)(content[message_key].format(count=word_count))
 
 def display_scenario_assessment():
     """Display 1 comprehensive writing scenario."""
     lang = st.session_state.language
+    content = CONTENT[lang]
     
-    st.header("📝 Part 3: Leadership Writing Scenario (1 Question)" if lang == 'en' else "📝 الجزء الثالث: سيناريو القيادة الكتابي (سؤال واحد)")
-    st.info("A comprehensive scenario requiring detailed leadership analysis" if lang == 'en' else "سيناريو شامل يتطلب تحليل قيادي مفصل")
+    st.header(content['scenario_header'])
+    st.info(content['scenario_info'])
     
     # Generate comprehensive scenario
     if not st.session_state.scenario_question:
-        with st.spinner("🤖 Creating your comprehensive leadership scenario..." if lang == 'en' else "🤖 إنشاء سيناريو القيادة الشامل..."):
+        with st.spinner(content['scenario_spinner']):
             try:
-                scenario = st.session_state.assessment_engine.generate_personalized_scenario(
-                    lang, st.session_state.user_profile
+                # Stream the scenario so the user reads it while it is being written
+                stream_placeholder = st.empty()
+                streamed = []
+                
+                def show_chunk(text: str) -> None:
+                    streamed.append(text)
+                    stream_placeholder.info("".join(streamed))
+                
+                scenario = get_engine().generate_personalized_scenario(
+                    lang, st.session_state.user_profile, on_chunk=show_chunk
                 )
+                stream_placeholder.empty()
                 st.session_state.scenario_question = scenario
-                st.success("✨ Your comprehensive scenario is ready!" if lang == 'en' else "✨ سيناريوك الشامل جاهز!")
+                st.success(content['scenario_success'])
             except Exception as e:
                 st.error(f"Failed to generate scenario: {str(e)}")
                 return
     
     # Display scenario
-    st.markdown("### Your Leadership Challenge:" if lang == 'en' else "### تحديك القيادي:")
+    st.markdown(content['scenario_challenge'])
     st.info(st.session_state.scenario_question)
     
-    # Response input
-    response = st.text_area(
-        "Your comprehensive response (200-300 words recommended):" if lang == 'en' else "إجابتك الشاملة (يُنصح بـ 200-300 كلمة):",
-        value=st.session_state.responses.get('scenario', ''),
-        height=300,
-        placeholder="Provide a detailed leadership analysis including: your approach, specific actions, stakeholder management, risk mitigation, timeline, and expected outcomes..." if lang == 'en' else "قدم تحليل قيادي مفصل يشمل: نهجك، الإجراءات المحددة، إدارة أصحاب المصلحة، تخفيف المخاطر، الجدول الزمني، والنتائج المتوقعة..."
-    )
-    
-    st.session_state.responses['scenario'] = response
-    
-    # Word count and guidance
-    word_count = len(response.split()) if response else 0
-    if word_count < 100:
-        st.warning(f"Word count: {word_count}. Add more detail for comprehensive analysis." if lang == 'en' else f"عدد الكلمات: {word_count}. أضف المزيد من التفاصيل للتحليل الشامل.")
-    elif word_count < 200:
-        st.info(f"Word count: {word_count}. Good progress - consider adding more depth." if lang == 'en' else f"عدد الكلمات: {word_count}. تقدم جيد - فكر في إضافة المزيد من العمق.")
-    else:
-        st.success(f"Word count: {word_count} ✓ Excellent comprehensive response!" if lang == 'en' else f"عدد الكلمات: {word_count} ✓ إجابة شاملة ممتازة!")
+    # Response input; edits rerun only this fragment
+    _scenario_response_input(content)
+    response = st.session_state.responses.get('scenario', '')
     
     # Progress indicator
-    st.progress(3/3, text="Progress: All 3 parts ready for analysis" if lang == 'en' else "التقدم: جميع الأجزاء الثلاثة جاهزة للتحليل")
+    st.progress(3/3, text=content['scenario_progress'])
     
     # Navigation
     col1, col2 = st.columns(2)
     
     with col1:
-        if st.button("⬅️ Back to Multiple Choice" if lang == 'en' else "⬅️ العودة للأسئلة متعددة الخيارات", use_container_width=True):
+        if st.button(content['scenario_back'], use_container_width=True):
             st.session_state.assessment_phase = 'mcq'
             st.rerun()
     
     with col2:
-        if st.button("🎯 Generate Detailed Report" if lang == 'en' else "🎯 إنشاء التقرير المفصل", type="primary", use_container_width=True):
+        if st.button(content['generate_report'], type="primary", use_container_width=True):
             if len(response.strip()) < 100:
-                st.error("Please provide a more comprehensive response (at least 100 words)." if lang == 'en' else "يرجى تقديم إجابة أكثر شمولية (100 كلمة على الأقل).")
+                st.error(content['scenario_too_short'])
             else:
                 # Generate comprehensive detailed report using Gemini Flash[3]
-                with st.spinner("🧠 AI is analyzing all 15 responses (7+7+1) and creating your detailed report..." if lang == 'en' else "🧠 الذكاء الاصطناعي يحلل جميع الإجابات الـ15 (7+7+1) وينشئ تقريرك المفصل..."):
+                with st.spinner(content['report_spinner']):
                     try:
-                        detailed_report = st.session_state.assessment_engine.generate_comprehensive_detailed_report(
-                            st.session_state.responses, lang, st.session_state.user_profile
+                        # A repeat click with unchanged answers reuses this session's report
+                        report_source = orjson.dumps(
+                            [lang, st.session_state.user_profile, st.session_state.responses],
+                            option=orjson.OPT_SORT_KEYS
                         )
+                        if st.session_state.detailed_report and st.session_state.report_source == report_source:
+                            detailed_report = st.session_state.detailed_report
+                        else:
+                            # Stream the report and advance a progress bar as text arrives. This stays
+                            # outside st.cache_data, which cannot replay draws on an outer element.
+                            progress = st.progress(0.0)
+                            received = 0
+                            
+                            def advance(text: str) -> None:
+                                nonlocal received
+                                received += len(text)
+                                progress.progress(min(received / REPORT_EXPECTED_CHARS, 0.95))
+                            
+                            detailed_report = get_engine().generate_comprehensive_detailed_report(
+                                st.session_state.responses, lang, st.session_state.user_profile, on_chunk=advance
+                            )
+                            progress.empty()
                         st.session_state.detailed_report = detailed_report
+                        st.session_state.report_source = report_source
                         st.session_state.assessment_phase = 'complete'
-                        st.success("🎉 Your detailed report is complete!" if lang == 'en' else "🎉 تقريرك المفصل مكتمل!")
+                        st.success(content['report_success'])
                         st.rerun()
                     except Exception as e:
                         st.error(f"Failed to generate detailed report: {str(e)}")
 
+@st.cache_data(show_spinner=False)
+def _build_radar(scores: tuple, pillars: tuple, name: str):
+    """Build the pillar radar chart once per set of scores."""
+    # plotly is only imported once a report is shown
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=list(scores),
+        theta=list(pillars),
+        fill='toself',
+        name=f"{name}'s Profile",
+        line_color='rgb(0, 123, 255)',
+        fillcolor='rgba(0, 123, 255, 0.3)'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True, 
+                range=[0, 10],
+                tickvals=[2, 4, 6, 8, 10],
+                tickmode='array'
+            )
+        ),
+        showlegend=True,
+        title=f"Detailed Leadership Assessment - {name}",
+        height=500
+    )
+    
+    return fig
+
 def display_detailed_report():
     """Display the comprehensive detailed report with multiple Arabic PDF solutions."""
     lang = st.session_state.language
@@ -1375,8 +1744,8 @@ def display_detailed_report():
     
     st.title(report.get('report_title', content['report_title']))
     
-    # Report header with comprehensive details
-    completion_time = datetime.now()
+    # Report header with comprehensive details; the completion time is fixed on first render
+    completion_time = st.session_state.setdefault('completion_time', datetime.now())
     duration = completion_time - st.session_state.start_time if st.session_state.start_time else None
     
     st.markdown(f"""
@@ -1391,62 +1760,36 @@ def display_detailed_report():
     """)
     
     # Executive Summary
-    st.subheader("📋 Executive Summary" if lang == 'en' else "📋 الملخص التنفيذي")
+    st.subheader(content['executive_summary'])
     st.write(report.get('executive_summary', 'Executive summary not available.'))
     
     # Overall Leadership Score
-    st.subheader("🎯 Overall Leadership Assessment" if lang == 'en' else "🎯 التقييم القيادي الإجمالي")
+    st.subheader(content['overall_assessment'])
     
     overall_score_data = report.get('overall_leadership_score', {})
     overall_score = overall_score_data.get('score', 7.0)
     
     col1, col2 = st.columns(2)
     with col1:
-        st.metric("Overall Score" if lang == 'en' else "النتيجة الإجمالية", f"{overall_score:.1f}/10")
+        st.metric(content['overall_score'], f"{overall_score:.1f}/10")
     with col2:
-        st.write("**Justification:**" if lang == 'en' else "**المبرر:**")
+        st.write(content['justification'])
         st.write(overall_score_data.get('justification', 'Justification not available.'))
     
     # Leadership Profile Breakdown
-    st.subheader("📊 Leadership Profile Breakdown" if lang == 'en' else "📊 تفصيل الملف القيادي")
+    st.subheader(content['profile_breakdown'])
     
     profile_breakdown = report.get('leadership_profile_breakdown', {})
+    pillars = content['pillars']
     
-    # Create radar chart from detailed scores
-    pillar_scores = []
-    for pillar in content['pillars']:
-        pillar_data = profile_breakdown.get(pillar, {})
-        score = pillar_data.get('score', 5.0)
-        pillar_scores.append(score)
-    
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=pillar_scores,
-        theta=content['pillars'],
-        fill='toself',
-        name=f"{st.session_state.user_profile['name']}'s Profile",
-        line_color='rgb(0, 123, 255)',
-        fillcolor='rgba(0, 123, 255, 0.3)'
-    ))
-    
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True, 
-                range=[0, 10],
-                tickvals=[2, 4, 6, 8, 10],
-                tickmode='array'
-            )
-        ),
-        showlegend=True,
-        title=f"Detailed Leadership Assessment - {st.session_state.user_profile['name']}",
-        height=500
-    )
+    # Create radar chart from detailed scores; tuples keep the _build_radar cache key hashable
+    pillar_scores = tuple(profile_breakdown.get(pillar, {}).get('score', 5.0) for pillar in pillars)
     
+    fig = _build_radar(pillar_scores, pillars, st.session_state.user_profile['name'])
     st.plotly_chart(fig, use_container_width=True)
     
     # Detailed analysis for each pillar
-    for pillar in content['pillars']:
+    for pillar in pillars:
         pillar_data = profile_breakdown.get(pillar, {})
         if pillar_data:
             with st.expander(f"📋 {pillar} - Score: {pillar_data.get('score', 'N/A')}/10", expanded=False):
@@ -1455,7 +1798,7 @@ def display_detailed_report():
                 
                 evidence = pillar_data.get('evidence_from_responses', [])
                 if evidence:
-                    st.write("**Evidence from Your Responses:**" if lang == 'en' else "**أدلة من إجاباتك:**")
+                    st.write(content['evidence'])
                     for i, ev in enumerate(evidence, 1):
                         st.write(f"{i}. {ev}")
     
@@ -1463,34 +1806,34 @@ def display_detailed_report():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.subheader("🌟 Your Strengths" if lang == 'en' else "🌟 نقاط قوتك")
+        st.subheader(content['strengths'])
         st.write(report.get('overall_strengths', 'Strengths analysis not available.'))
     
     with col2:
-        st.subheader("📈 Development Areas" if lang == 'en' else "📈 مجالات التطوير")
+        st.subheader(content['development_areas'])
         st.write(report.get('overall_development_areas', 'Development areas analysis not available.'))
     
     # Detailed Insights from Response Types
     insights = report.get('detailed_insights_from_response_types', {})
     if insights:
-        st.subheader("🔍 Response Pattern Analysis" if lang == 'en' else "🔍 تحليل أنماط الإجابات")
+        st.subheader(content['response_patterns'])
         
         insight_col1, insight_col2, insight_col3 = st.columns(3)
         
         with insight_col1:
-            st.markdown("**Yes/No/Maybe Patterns**" if lang == 'en' else "**أنماط نعم/لا/ربما**")
+            st.markdown(content['yes_no_patterns'])
             st.write(insights.get('yes_no_patterns', 'Analysis not available.'))
         
         with insight_col2:
-            st.markdown("**MCQ Choice Analysis**" if lang == 'en' else "**تحليل الاختيارات متعددة الخيارات**")
+            st.markdown(content['mcq_analysis'])
             st.write(insights.get('mcq_choice_analysis', 'Analysis not available.'))
         
         with insight_col3:
-            st.markdown("**Writing Analysis**" if lang == 'en' else "**تحليل الكتابة**")
+            st.markdown(content['writing_analysis'])
             st.write(insights.get('scenario_writing_analysis', 'Analysis not available.'))
     
     # Personalized Recommendations
-    st.subheader("💡 Personalized Recommendations" if lang == 'en' else "💡 التوصيات الشخصية")
+    st.subheader(content['recommendations'])
     recommendations = report.get('personalized_recommendations', [])
     if recommendations:
         for i, rec in enumerate(recommendations, 1):
@@ -1499,26 +1842,26 @@ def display_detailed_report():
         st.write("Recommendations not available.")
     
     # Personal Development Plan
-    st.subheader("📅 Personal Development Plan" if lang == 'en' else "📅 خطة التطوير الشخصية")
+    st.subheader(content['development_plan'])
     
     dev_plan = report.get('personal_development_plan', {})
     if dev_plan:
         plan_col1, plan_col2, plan_col3 = st.columns(3)
         
         with plan_col1:
-            st.markdown("**30-Day Goals**" if lang == 'en' else "**أهداف 30 يوم**")
+            st.markdown(content['goals_30'])
             goals_30 = dev_plan.get('30_day_goals', [])
             for goal in goals_30:
                 st.write(f"- {goal}")
         
         with plan_col2:
-            st.markdown("**90-Day Goals**" if lang == 'en' else "**أهداف 90 يوم**")
+            st.markdown(content['goals_90'])
             goals_90 = dev_plan.get('90_day_goals', [])
             for goal in goals_90:
                 st.write(f"- {goal}")
         
         with plan_col3:
-            st.markdown("**6-Month Goals**" if lang == 'en' else "**أهداف 6 أشهر**")
+            st.markdown(content['goals_6m'])
             goals_6m = dev_plan.get('6_month_goals', [])
             for goal in goals_6m:
                 st.write(f"- {goal}")
@@ -1526,13 +1869,13 @@ def display_detailed_report():
     # Cultural and Industry Nuances
     cultural_analysis = report.get('cultural_and_industry_nuances')
     if cultural_analysis:
-        st.subheader("🌍 Cultural & Industry Context" if lang == 'en' else "🌍 السياق الثقافي والصناعي")
+        st.subheader(content['cultural_context'])
         st.write(cultural_analysis)
     
     # Closing Remarks
     closing = report.get('closing_remarks')
     if closing:
-        st.subheader("🎯 Closing Remarks" if lang == 'en' else "🎯 ملاحظات ختامية")
+        st.subheader(content['closing_remarks'])
         st.info(closing)
     
     # Action buttons with multiple Arabic PDF solutions
@@ -1543,18 +1886,20 @@ def display_detailed_report():
         if st.button(content['download_report'], use_container_width=True):
             try:
                 # Enhanced PDF with Arabic font support
-                with st.spinner("Generating enhanced PDF..." if lang == 'en' else "جاري إنشاء PDF محسّن..."):
-                    pdf_bytes = st.session_state.assessment_engine.generate_enhanced_pdf_report(
-                        report, st.session_state.user_profile, lang
+                with st.spinner(content['pdf_spinner']):
+                    pdf_bytes = _build_pdf(
+                        orjson.dumps(report).decode(),
+                        orjson.dumps(st.session_state.user_profile, option=orjson.OPT_SORT_KEYS).decode(),
+                        lang
                     )
                 
                 st.download_button(
-                    label="📄 Download Enhanced PDF" if lang == 'en' else "📄 تحميل PDF محسّن",
+                    label=content['pdf_download'],
                     data=pdf_bytes,
                     file_name=f"enhanced_leadership_report_{st.session_state.user_profile['name'].replace(' ', '_')}_{completion_time.strftime('%Y%m%d')}.pdf",
                     mime="application/pdf"
                 )
-                st.success("Enhanced PDF ready!" if lang == 'en' else "PDF محسّن جاهز!")
+                st.success(content['pdf_ready'])
                 
             except Exception as e:
                 st.error(f"Enhanced PDF generation failed: {str(e)}")
@@ -1563,14 +1908,16 @@ def display_detailed_report():
         if st.button(content['view_printable'], use_container_width=True):
             try:
                 # HTML report for browser printing
-                html_report = st.session_state.assessment_engine.generate_html_report(
-                    report, st.session_state.user_profile, lang
+                html_report = _build_html(
+                    orjson.dumps(report).decode(),
+                    orjson.dumps(st.session_state.user_profile, option=orjson.OPT_SORT_KEYS).decode(),
+                    lang
                 )
                 
                 # Display HTML report in iframe
                 st.components.v1.html(html_report, height=800, scrolling=True)
                 
-                st.success("Use Ctrl+P to print as PDF from browser" if lang == 'en' else "استخدم Ctrl+P للطباعة كـ PDF من المتصفح")
+                st.success(content['print_hint'])
                 
             except Exception as e:
                 st.error(f"HTML report generation failed: {str(e)}")
@@ -1579,24 +1926,28 @@ def display_detailed_report():
         if st.button(content['new_assessment'], use_container_width=True):
             # Keep engine but reset everything else
             engine = st.session_state.assessment_engine
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            st.session_state.clear()
             initialize_session_state()
             st.session_state.assessment_engine = engine
             st.rerun()
     
     with col4:
-        if st.button("📊 Assessment Analytics" if lang == 'en' else "📊 تحليلات التقييم", use_container_width=True):
-            st.info("Advanced analytics coming soon" if lang == 'en' else "التحليلات المتقدمة قادمة قريباً")
+        if st.button(content['analytics'], use_container_width=True):
+            st.info(content['analytics_soon'])
 
 def main():
     """Main application controller with enhanced Arabic PDF support."""
     initialize_session_state()
     display_language_selector()
     
-    # Check API connection
-    if not check_api_connection():
+    # Check API connection once per session; a failed check is only repeated on Retry
+    if 'api_ok' not in st.session_state:
+        st.session_state.api_ok = check_api_connection()
+    if not st.session_state.api_ok:
         st.error("Failed to initialize AI Assessment Engine. Please check your API configuration.")
+        if st.button("Retry"):
+            del st.session_state['api_ok']
+            st.rerun()
         return
     
     # Main application flow
@@ -1614,8 +1965,8 @@ def main():
         elif st.session_state.assessment_phase == 'complete':
             display_detailed_report()
     except Exception as e:
-        st.error(f"Application error: {str(e)}")
-        logger.error(f"Application error: {str(e)}")
+        st.error(f"Application error: {e}")
+        logger.exception("Application error")
 
 if __name__ == '__main__':
     main()
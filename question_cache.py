@@ -0,0 +1,77 @@
+"""
+On-disk cache for validated model responses.
+Entries are keyed by SHA-256 of the model name, generation config and prompt.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.getenv("QUESTION_CACHE_DIR", os.path.join(".cache", "questions"))
+
+# Minimum seconds between directory sweeps for expired entries
+PRUNE_INTERVAL = 3600.0
+_last_prune = 0.0
+
+def response_key(model_name: str, prompt: str, generation_config: Optional[Dict] = None) -> str:
+    """Build a content-addressed key for one model call."""
+    config = orjson.dumps(generation_config, option=orjson.OPT_SORT_KEYS, default=str).decode()
+    return hashlib.sha256("\0".join((model_name, config, prompt)).encode('utf-8')).hexdigest()
+
+def _path(key: str) -> str:
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+def get(key: str, max_age: Optional[float] = None) -> Optional[Any]:
+    """Return the cached value for key, or None if it is missing, unreadable or older than max_age seconds (expired files are removed)."""
+    path = _path(key)
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+            os.unlink(path)
+            return None
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Question cache read failed for %s: %s", key, e)
+        return None
+
+def set(key: str, value: Any) -> None:
+    """Write value atomically so concurrent readers never see a partial file."""
+    path = _path(key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(value))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning("Question cache write failed for %s: %s", key, e)
+
+def prune(max_age: float) -> None:
+    """Delete entries (and abandoned temp files) older than max_age seconds, at most once per PRUNE_INTERVAL."""
+    global _last_prune
+    now = time.time()
+    if now - _last_prune < PRUNE_INTERVAL:
+        return
+    _last_prune = now
+    for root, _, files in os.walk(CACHE_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                if now - os.path.getmtime(path) > max_age:
+                    os.unlink(path)
+            except OSError:
+                # Already removed by a concurrent reader or sweep
+                continue